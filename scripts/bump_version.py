@@ -1,50 +1,98 @@
 #!/usr/bin/env python3
 """Bump the version in pyproject.toml and src/enveloper/__init__.py."""
 
-from __future__ import annotations
-
+import functools
+import os
 import re
 import sys
-from pathlib import Path
 
-PYPROJECT = Path("pyproject.toml")
-INIT = Path("src/enveloper/__init__.py")
+PYPROJECT = "pyproject.toml"
+INIT = "src/enveloper/__init__.py"
+
+# (major, minor, patch) increments per bump part.
+_DELTAS: dict[str, tuple[int, int, int]] = {
+    "major": (1, 0, 0),
+    "minor": (0, 1, 0),
+    "patch": (0, 0, 1),
+}
+
+
+@functools.cache
+def _patterns() -> tuple[re.Pattern[str], re.Pattern[str]]:
+    """Compile the pyproject/``__init__`` version patterns once, on first use."""
+    return (
+        re.compile(r'^version\s*=\s*"(\d+\.\d+\.\d+)"', re.MULTILINE),
+        re.compile(r'^__version__\s*=\s*"(\d+\.\d+\.\d+)"', re.MULTILINE),
+    )
+
+
+def _splice(text: str, m: re.Match[str], new: str) -> str:
+    """Replace the version captured by *m* with *new*, reusing the match span."""
+    return text[: m.start(1)] + new + text[m.end(1):]
+
+
+def _slurp(path: str) -> str:
+    """Read *path* with a single ``os.read`` sized from ``fstat``."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size).decode("utf-8")
+    finally:
+        os.close(fd)
 
-VERSION_RE = re.compile(r'^version\s*=\s*"(\d+\.\d+\.\d+)"', re.MULTILINE)
-INIT_RE = re.compile(r'^__version__\s*=\s*"(\d+\.\d+\.\d+)"', re.MULTILINE)
+
+def _write_all(updates: list[tuple[str, str]]) -> None:
+    """Write every staged ``(path, text)`` pair, then fsync them together.
+
+    All new contents are computed before this is called, so a bad pattern or
+    unknown part never leaves the two files disagreeing about the version.
+    """
+    fds: list[int] = []
+    try:
+        for path, text in updates:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            fds.append(fd)
+            os.write(fd, text.encode())
+        for fd in fds:
+            os.fsync(fd)
+    finally:
+        for fd in fds:
+            os.close(fd)
 
 
 def bump(part: str) -> str:
-    text = PYPROJECT.read_text()
-    m = VERSION_RE.search(text)
-    if not m:
-        print("Could not find version in pyproject.toml", file=sys.stderr)
+    delta = _DELTAS.get(part)
+    if delta is None:
+        print(f"Unknown part: {part}. Use major, minor, or patch.", file=sys.stderr)
         sys.exit(1)
 
-    old = m.group(1)
-    major, minor, patch = (int(x) for x in old.split("."))
-
-    if part == "major":
-        major += 1
-        minor = 0
-        patch = 0
-    elif part == "minor":
-        minor += 1
-        patch = 0
-    elif part == "patch":
-        patch += 1
-    else:
-        print(f"Unknown part: {part}. Use major, minor, or patch.", file=sys.stderr)
+    version_re, init_re = _patterns()
+    text = _slurp(PYPROJECT)
+    m = version_re.search(text)
+    if not m:
+        print("Could not find version in pyproject.toml", file=sys.stderr)
         sys.exit(1)
 
-    new = f"{major}.{minor}.{patch}"
+    major, minor, patch = (int(x) for x in m.group(1).split(".", 2))
+    d_major, d_minor, d_patch = delta
+    # A bump resets every lower component: keep minor only for minor/patch bumps,
+    # keep patch only for patch bumps.
+    keep_minor = d_major == 0
+    keep_patch = keep_minor and d_minor == 0
+    new = ".".join((
+        str(major + d_major),
+        str((minor + d_minor) * keep_minor),
+        str((patch + d_patch) * keep_patch),
+    ))
 
-    PYPROJECT.write_text(VERSION_RE.sub(f'version = "{new}"', text))
+    updates = [(PYPROJECT, _splice(text, m, new))]
 
-    if INIT.exists():
-        init_text = INIT.read_text()
-        INIT.write_text(INIT_RE.sub(f'__version__ = "{new}"', init_text))
+    if os.path.exists(INIT):
+        init_text = _slurp(INIT)
+        im = init_re.search(init_text)
+        if im and im.group(1) != new:
+            updates.append((INIT, _splice(init_text, im, new)))
 
+    _write_all(updates)
     return new
 
 
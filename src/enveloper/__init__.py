@@ -3,7 +3,26 @@
 
 """Enveloper -- manage .env secrets via system keychain with cloud store plugins."""
 
-from enveloper.sdk import dotenv_values, load_dotenv
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from enveloper.sdk import dotenv_values, load_dotenv
 
 __all__ = ["__version__", "load_dotenv", "dotenv_values"]
 __version__ = "0.1.16"
+
+_SDK_NAMES = ("load_dotenv", "dotenv_values")
+
+
+def __getattr__(name: str) -> Any:
+    """Import the SDK on first access to ``load_dotenv``/``dotenv_values`` (PEP 562)."""
+    if name in _SDK_NAMES:
+        from enveloper import sdk
+
+        g = globals()
+        for attr in _SDK_NAMES:
+            g[attr] = getattr(sdk, attr)
+        return g[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,11 +5,26 @@
 
 from __future__ import annotations
 
+import os
 import sys
 
 
+def _prog_name() -> str:
+    """Program name as click would report it in ``--version`` output."""
+    name = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else "enveloper"
+    if name == "__main__.py":
+        return "python -m enveloper"
+    return name
+
+
 def main() -> None:
     """Run the CLI."""
+    if sys.argv[1:2] == ["--version"]:
+        # Fast path: answer --version without importing click, rich, or any store.
+        from enveloper import __version__
+
+        sys.stdout.write(f"{_prog_name()}, version {__version__}\n")
+        return
     try:
         from enveloper.cli import cli
     except ImportError:
@@ -4,30 +4,24 @@
 """Enveloper CLI -- manage .env secrets via system keychain + cloud stores.
 
 The CLI is split into per-command modules under this package.  The ``cli``
-click group, shared helpers (``console``, ``common_options``, ``_get_store``,
+click group, shared helpers (``_console``, ``common_options``, ``_get_store``,
 etc.) live here so every command module can import them.
 """
 
 from __future__ import annotations
 
 import functools
-import importlib.util
+import importlib
 import os
+import sys
+from collections.abc import Iterable, Sequence
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
 
 import click
-from rich.console import Console
-from rich.style import Style
-from rich.text import Text
 
 from enveloper import __version__
-from enveloper.config import load_config
-from enveloper.resolve_store import get_store as resolve_get_store
-from enveloper.resolve_store import make_cloud_store as resolve_make_cloud_store
 from enveloper.store import SecretStore
-from enveloper.stores import get_service_entries
-from enveloper.stores.github import GitHubStore
-from enveloper.stores.keychain import KeychainStore
 from enveloper.util import key_to_export_name
 
 __all__ = [
@@ -40,15 +34,62 @@ __all__ = [
 ]
 
 if TYPE_CHECKING:
-    pass
+    from pathlib import Path
 
-HAS_YAML = importlib.util.find_spec("yaml") is not None
+    from rich.console import Console
+    from rich.text import Text
+
+    from enveloper.config import EnveloperConfig
+    from enveloper.stores import get_service_entries
+    from enveloper.stores.github import GitHubStore
+    from enveloper.stores.keychain import KeychainStore
+
+# Re-exported names that pull in keyring / the store registry; resolved on first access.
+_LAZY_EXPORTS = {
+    "KeychainStore": "enveloper.stores.keychain",
+    "GitHubStore": "enveloper.stores.github",
+    "get_service_entries": "enveloper.stores",
+}
+
+
+@functools.cache
+def _load_yaml() -> ModuleType | None:
+    """Import PyYAML on first use; ``None`` when it is not installed."""
+    try:
+        import yaml
+    except ImportError:
+        return None
+    return yaml
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve store re-exports lazily so importing the CLI does not load keyring (PEP 562)."""
+    if name == "HAS_YAML":
+        return _load_yaml() is not None
+    if name == "console":
+        # Kept for callers that imported the old module-level stderr console.
+        return _console()
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-console = Console(stderr=True)
+
+@functools.cache
+def _console() -> Console:
+    """Shared stderr console, created (and rich imported) on first use."""
+    from rich.console import Console
+
+    return Console(stderr=True)
 
 
 def _doc_link(url: str, label: str = "Doc Link") -> Text:
     """Rich Text with an OSC 8 hyperlink for terminal clickability."""
+    from rich.style import Style
+    from rich.text import Text
+
     return Text(label, style=Style(link=url))
 
 
@@ -56,31 +97,51 @@ def _doc_link(url: str, label: str = "Doc Link") -> Text:
 # Shared helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=64)
 def _get_keychain(project: str, domain: str | None) -> KeychainStore:
+    """KeychainStore for (project, domain), reused across calls.
+
+    The store keeps no per-call state (every read goes to keyring), so one
+    instance per scope is safe to share.
+    """
+    from enveloper.stores.keychain import KeychainStore
+
     return KeychainStore(project=project, domain=domain)
 
 
 def _get_store(ctx: click.Context) -> SecretStore:
-    """Return the current store for get/set/list/import/export."""
-    service = ctx.obj.get("service", "local")
-    project = ctx.obj["project"]
-    domain = ctx.obj.get("domain_resolved", "_default_")
-    cfg = ctx.obj["config"]
-    env_name = ctx.obj["env_name"]
-    path = ctx.obj.get("path", ".env")
-    version = ctx.obj.get("version")
-    try:
-        return resolve_get_store(
-            service, project, domain, cfg,
-            path=path, env_name=env_name, version=version,
-        )
-    except ValueError as e:
-        raise click.UsageError(str(e))
+    """Return the current store for get/set/list/import/export.
+
+    Stores are memoized on ``ctx.obj`` per resolved option tuple, so repeated
+    calls within one invocation reuse the same instance (and its client).
+    """
+    from enveloper.resolve_store import get_store as resolve_get_store
+
+    obj = ctx.obj
+    service = obj.get("service", "local")
+    project = obj["project"]
+    domain = obj.get("domain_resolved", "_default_")
+    env_name = obj["env_name"]
+    path = obj.get("path", ".env")
+    version = obj.get("version")
+    cache: dict[tuple[str | None, ...], SecretStore] = obj.setdefault("_stores", {})
+    cache_key = (service, project, domain, path, env_name, version)
+    store = cache.get(cache_key)
+    if store is None:
+        try:
+            store = resolve_get_store(
+                service, project, domain, obj["config"],
+                path=path, env_name=env_name, version=version,
+            )
+        except ValueError as e:
+            raise click.UsageError(str(e))
+        cache[cache_key] = store
+    return store
 
 
 def _make_cloud_store(
     store_name: str,
-    cfg: object,
+    cfg: EnveloperConfig,
     project: str | None,
     domain: str | None,
     env_name: str | None,
@@ -91,13 +152,12 @@ def _make_cloud_store(
     repo: str | None = None,
 ) -> SecretStore:
     """Instantiate a cloud store with resolved options."""
-    from enveloper.config import EnveloperConfig
+    from enveloper import resolve_store
 
-    assert isinstance(cfg, EnveloperConfig)
     domain_str = domain or "_default_"
     project_str = project or "_default_"
     try:
-        return resolve_make_cloud_store(
+        return resolve_store.make_cloud_store(
             store_name, cfg, domain_str, env_name,
             project=project_str,
             prefix=prefix, profile=profile, region=region, repo=repo,
@@ -106,58 +166,82 @@ def _make_cloud_store(
         raise click.UsageError(str(e))
 
 
-def _mask(value: str) -> str:
-    if len(value) <= 6:
-        return "****"
-    return value[:3] + "****" + value[-3:]
+def _print_table(title: str, columns: Sequence[tuple[str, str]], rows: Iterable[Sequence[str]]) -> None:
+    """Render *rows* as a Rich table on stderr, or as tab-separated lines on stdout when piped.
 
+    *columns* are ``(header, style)`` pairs. When stdout is not a terminal the
+    rows are written plainly (no header) so ``grep``/``awk`` can consume them,
+    and rich's measure/render passes are skipped entirely.
+    """
+    if not sys.stdout.isatty():
+        sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
+        return
+    from rich.table import Table
 
-def _merge_common(
-    ctx: click.Context,
-    project: str | None,
-    domain: str | None,
-    service: str | None,
-    version: str | None = None,
-) -> None:
-    """Merge subcommand-level project/domain/service/version into ctx.obj."""
-    if project is not None:
-        ctx.obj["project"] = project
-    if domain is not None:
-        ctx.obj["domain"] = domain
-    ctx.obj["domain_resolved"] = ctx.obj["domain"] or "_default_"
-    if service is not None:
-        ctx.obj["service"] = service
-    if version is not None:
-        ctx.obj["version"] = version
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    for row in rows:
+        table.add_row(*row)
+    _console().print(table)
+
+
+def _mask(value: str) -> str:
+    """Show the first and last three characters; values of six or fewer are fully hidden."""
+    return "****" if len(value) <= 6 else f"{value[:3]}****{value[-3:]}"
 
 
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+# Built once and shared by every command that uses @common_options.
+_COMMON_OPTIONS: tuple[click.Option, ...] = (
+    click.Option(
+        ["--service", "-s"], default=None,
+        help="Backend: local, file (.env), or cloud. Default: ENVELOPER_SERVICE or config, else local.",
+    ),
+    click.Option(
+        ["--domain", "-d"], default=None,
+        help="Domain / subsystem scope (default: from ENVELOPER_DOMAIN env var).",
+    ),
+    click.Option(
+        ["--project", "-p"], default=None,
+        help="Project namespace (default: from config or ENVELOPER_PROJECT env var).",
+    ),
+    click.Option(["--version"], default=None, help="Version (semver format, default: 1.0.0)."),
+)
+
+
 def common_options(f: F) -> F:
     """Add --project, --domain, --service, --version to a command."""
-    @functools.wraps(f)  # type: ignore[arg-type]
-    @click.option(
-        "--service", "-s", default=None,
-        help="Backend: local, file (.env), or cloud. Default: ENVELOPER_SERVICE or config, else local.",
-    )
-    @click.option("--domain", "-d", default=None, help="Domain / subsystem scope (default: from ENVELOPER_DOMAIN env var).")
-    @click.option("--project", "-p", default=None, help="Project namespace (default: from config or ENVELOPER_PROJECT env var).")
-    @click.option("--version", default=None, help="Version (semver format, default: 1.0.0).")
-    @click.pass_context
+    @functools.wraps(f)
     def wrapper(
-        ctx: click.Context,
-        project: str | None,
-        domain: str | None,
-        service: str | None,
-        version: str | None,
         *args: Any,
+        project: str | None = None,
+        domain: str | None = None,
+        service: str | None = None,
+        version: str | None = None,
         **kwargs: Any,
     ) -> Any:
-        _merge_common(ctx, project, domain, service)
+        # Merge subcommand-level values over the group-level ones in ctx.obj.
+        ctx = click.get_current_context()
+        obj = ctx.obj
+        if project is not None:
+            obj["project"] = project
+        if domain is not None:
+            obj["domain"] = domain
+        obj["domain_resolved"] = obj["domain"] or "_default_"
+        if service is not None:
+            obj["service"] = service
         if version is not None:
-            ctx.obj["version"] = version
+            obj["version"] = version
         return f(ctx, *args, **kwargs)
+
+    # click collects decorator-declared params from __click_params__ in reverse;
+    # keep any options/arguments declared below @common_options.
+    wrapper.__click_params__ = [  # type: ignore[attr-defined]
+        *getattr(f, "__click_params__", []), *reversed(_COMMON_OPTIONS),
+    ]
     return cast(F, wrapper)
 
 
@@ -165,6 +249,93 @@ def common_options(f: F) -> F:
 # Top-level click group
 # ---------------------------------------------------------------------------
 
+# Subcommand name -> "module:attribute". Modules are imported only when the
+# command is dispatched (or when --help needs its short description).
+_LAZY_COMMANDS: dict[str, str] = {
+    "clear": "enveloper.cli.clear_cmd:clear",
+    "delete": "enveloper.cli.crud_cmd:delete",
+    "export": "enveloper.cli.export_cmd:export",
+    "generate": "enveloper.cli.generate_cmd:generate",
+    "get": "enveloper.cli.crud_cmd:get",
+    "import": "enveloper.cli.import_cmd:import_env",
+    "init": "enveloper.cli.init_cmd:init",
+    "list": "enveloper.cli.list_cmd:list_keys",
+    "pull": "enveloper.cli.push_pull_cmd:pull",
+    "push": "enveloper.cli.push_pull_cmd:push",
+    "service": "enveloper.cli.service_cmd:service_list",
+    "set": "enveloper.cli.crud_cmd:set_key",
+    "stores": "enveloper.cli.service_cmd:stores",
+    "unexport": "enveloper.cli.export_cmd:unexport",
+}
+
+
+class LazyGroup(click.Group):
+    """click group whose subcommands live in modules imported on first use."""
+
+    def __init__(self, *args: Any, lazy_commands: dict[str, str] | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None or cmd_name not in self.lazy_commands:
+            return cmd
+        module_name, attr = self.lazy_commands[cmd_name].split(":", 1)
+        cmd = cast(click.Command, getattr(importlib.import_module(module_name), attr))
+        self.add_command(cmd, cmd_name)
+        return cmd
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_at(path: Path | None, stamp: tuple[int, int] | None) -> EnveloperConfig:
+    """Parse the config at *path*; *stamp* only keys the cache."""
+    from enveloper.config import EnveloperConfig, load_config
+
+    return load_config(path) if path is not None else EnveloperConfig()
+
+
+def _load_config_cached() -> EnveloperConfig:
+    """``load_config()`` memoized on the config file's path, mtime and size.
+
+    Shell completion runs the group callback on every Tab, so an unchanged
+    ``.enveloper.toml`` is parsed only once per process.
+    """
+    from enveloper.config import find_config_file
+
+    path = find_config_file()
+    stamp = None
+    if path is not None:
+        try:
+            st = path.stat()
+        except OSError:
+            pass
+        else:
+            stamp = (st.st_mtime_ns, st.st_size)
+    return _load_config_at(path, stamp)
+
+
+# Where ``enveloper --cprofile`` writes its cProfile stats.
+PROFILE_PATH = "~/.enveloper_profile.pstats"
+
+
+def _start_profile(ctx: click.Context) -> None:
+    """Profile the rest of this invocation; stats are dumped when the context closes."""
+    import cProfile
+
+    prof = cProfile.Profile()
+
+    def _dump() -> None:
+        prof.disable()
+        out = os.path.expanduser(PROFILE_PATH)
+        prof.dump_stats(out)
+        _console().print(f"[dim]Profile written to {out} (view with: python -m pstats {out})[/dim]")
+
+    ctx.call_on_close(_dump)
+    prof.enable()
+
 
 def _cli_callback(
     ctx: click.Context,
@@ -174,27 +345,31 @@ def _cli_callback(
     path: str | None,
     env_name: str | None,
     verbose: bool,
+    cprofile: bool,
 ) -> None:
     """Manage .env secrets via system keychain with cloud store plugins."""
-    cfg = load_config()
-    ctx.ensure_object(dict)
-    ctx.obj["config"] = cfg
-    ctx.obj["project"] = project or os.environ.get("ENVELOPER_PROJECT") or cfg.project
-    ctx.obj["domain"] = domain or os.environ.get("ENVELOPER_DOMAIN")
-    ctx.obj["domain_resolved"] = ctx.obj["domain"] or "_default_"
-    ctx.obj["service"] = (
+    if cprofile:
+        _start_profile(ctx)
+    cfg = _load_config_cached()
+    env = os.environ
+    obj = ctx.ensure_object(dict)
+    obj["config"] = cfg
+    obj["project"] = project or env.get("ENVELOPER_PROJECT") or cfg.project
+    obj["domain"] = domain = domain or env.get("ENVELOPER_DOMAIN")
+    obj["domain_resolved"] = domain or "_default_"
+    obj["service"] = (
         service
         if service is not None
-        else (os.environ.get("ENVELOPER_SERVICE") or cfg.service or "local")
+        else (env.get("ENVELOPER_SERVICE") or cfg.service or "local")
     )
-    ctx.obj["path"] = path if path is not None else ".env"
-    ctx.obj["env_name"] = env_name
-    ctx.obj["verbose"] = verbose
+    obj["path"] = path if path is not None else ".env"
+    obj["env_name"] = env_name
+    obj["verbose"] = verbose
 
 
 cli = cast(
     click.Group,
-    click.group()(
+    click.group(cls=LazyGroup, lazy_commands=_LAZY_COMMANDS)(
         click.option(
             "--project", "-p", default=None,
             help="Project namespace (default: from config or ENVELOPER_PROJECT env var).",
@@ -210,8 +385,16 @@ cli = cast(
                     click.option("--path", default=None, help="Path to .env file when --service file (default: .env).")(
                         click.option("--env", "-e", "env_name", default=None, help="Environment name (resolves {env}).")(
                             click.option("--verbose", "-v", is_flag=True, help="Verbose output.")(
-                                click.version_option(__version__)(
-                                    click.pass_context(_cli_callback)
+                                click.option(
+                                    "--cprofile", is_flag=True,
+                                    help=(
+                                        f"Profile the command with cProfile and write stats to {PROFILE_PATH}. "
+                                        "For import time, set PYTHONPROFILEIMPORTTIME=1."
+                                    ),
+                                )(
+                                    click.version_option(__version__)(
+                                        click.pass_context(_cli_callback)
+                                    )
                                 )
                             )
                         )
@@ -221,20 +404,3 @@ cli = cast(
         )
     ),
 )
-
-
-# ---------------------------------------------------------------------------
-# Register all command modules (import triggers @cli.command registration)
-# ---------------------------------------------------------------------------
-
-from enveloper.cli import (  # noqa: E402, F401
-    clear_cmd,
-    crud_cmd,
-    export_cmd,
-    generate_cmd,
-    import_cmd,
-    init_cmd,
-    list_cmd,
-    push_pull_cmd,
-    service_cmd,
-)
@@ -7,10 +7,10 @@ from __future__ import annotations
 
 import click
 
-from enveloper.cli import KeychainStore, _get_keychain, _get_store, cli, common_options, console
+from enveloper.cli import _console, _get_keychain, _get_store, common_options
 
 
-@cli.command()
+@click.command()
 @click.option(
     "--quiet", "-q",
     is_flag=True,
@@ -28,17 +28,14 @@ def clear(ctx: click.Context, quiet: bool) -> None:
 
     if service == "local" and ctx.obj["domain"] is None:
         project = ctx.obj["project"]
-        global_store = KeychainStore(project=project)
-        domains_to_clear = global_store.list_domains() or ["_default_"]
-        for d in domains_to_clear:
-            store = _get_keychain(project, d)
-            store.clear()
-        console.print("[green]Cleared all secrets for service 'local' (all domains)[/green]")
+        global_store = _get_keychain(project, None)
+        global_store.clear_domains(global_store.list_domains() or ["_default_"])
+        _console().print("[green]Cleared all secrets for service 'local' (all domains)[/green]")
     else:
         store_to_clear = _get_store(ctx)
         store_to_clear.clear()
         if service == "local":
             domain = ctx.obj["domain_resolved"]
-            console.print(f"[green]Cleared all secrets for service 'local' (domain '{domain}')[/green]")
+            _console().print(f"[green]Cleared all secrets for service 'local' (domain '{domain}')[/green]")
         else:
-            console.print(f"[green]Cleared all secrets for service '{service}'[/green]")
+            _console().print(f"[green]Cleared all secrets for service '{service}'[/green]")
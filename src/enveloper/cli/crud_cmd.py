@@ -7,10 +7,10 @@ from __future__ import annotations
 
 import click
 
-from enveloper.cli import KeychainStore, _get_store, cli, common_options, console
+from enveloper.cli import _console, _get_store, common_options
 
 
-@cli.command()
+@click.command()
 @click.argument("key")
 @common_options
 def get(ctx: click.Context, key: str) -> None:
@@ -22,25 +22,27 @@ def get(ctx: click.Context, key: str) -> None:
     click.echo(value)
 
 
-@cli.command("set")
+@click.command("set")
 @click.argument("key")
 @click.argument("value")
 @common_options
 def set_key(ctx: click.Context, key: str, value: str) -> None:
     """Set a single secret."""
+    from enveloper.stores.keychain import KeychainStore
+
     store = _get_store(ctx)
     if isinstance(store, KeychainStore):
         store.set_with_domain_tracking(key, value)
     else:
         store.set(key, value)
-    console.print(f"[green]Set {key}[/green]")
+    _console().print(f"[green]Set {key}[/green]")
 
 
-@cli.command()
+@click.command()
 @click.argument("key")
 @common_options
 def delete(ctx: click.Context, key: str) -> None:
     """Remove a single secret."""
     store = _get_store(ctx)
     store.delete(key)
-    console.print(f"[green]Removed {key}[/green]")
+    _console().print(f"[green]Removed {key}[/green]")
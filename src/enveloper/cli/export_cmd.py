@@ -5,34 +5,31 @@
 
 from __future__ import annotations
 
-import json
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from shlex import quote as _shell_escape
+from types import ModuleType
+from typing import Any, TextIO
 
 import click
-from rich.console import Console
 
 from enveloper.cli import (
-    HAS_YAML,
-    KeychainStore,
     SecretStore,
+    _console,
     _get_keychain,
     _get_store,
-    cli,
+    _load_yaml,
     common_options,
-    console,
     key_to_export_name,
 )
-
-if HAS_YAML:
-    import yaml
-
+from enveloper.util import json_dumps_pretty
 
 # ---------------------------------------------------------------------------
 # export
 # ---------------------------------------------------------------------------
 
-@cli.command("export")
+@click.command("export")
 @click.option(
     "--format", "fmt",
     type=click.Choice(["dotenv", "unix", "win", "json", "yaml"]),
@@ -60,85 +57,92 @@ def export(ctx: click.Context, fmt: str, output: str | None) -> None:
 
     store: SecretStore
     if service == "local" and domain is None:
-        global_store = KeychainStore(project=project)
+        global_store = _get_keychain(project, None)
         domains = global_store.list_domains() or ["_default_"]
-        pairs = {}
-        for d in domains:
-            store = _get_keychain(project, d)
-            for key in store.list_keys():
-                val = store.get(key)
-                if val is not None:
-                    pairs[key] = val
+        # One dict() over every domain's pairs; later domains win on duplicate keys.
+        pairs: dict[str, str] = dict(
+            (key, val)
+            for entries in global_store.read_domains(domains).values()
+            for key, val in entries
+            if val is not None
+        )
     else:
         store = _get_store(ctx)
-        pairs = {}
-        use_export_name = service not in ("local", "file")
-        for key in store.list_keys():
-            val = store.get(key)
-            if val is not None:
-                out_key = key_to_export_name(store, key) if use_export_name else key
-                pairs[out_key] = val
+        pairs = store.items()
+        if service not in ("local", "file"):
+            pairs = {key_to_export_name(store, key): val for key, val in pairs.items()}
 
+    # Sort once; every format below writes in this order instead of re-sorting.
+    pairs = dict(sorted(pairs.items()))
     if output:
-        path = Path(output)
-        with path.open("w") as f:
-            if fmt == "json":
-                f.write(json.dumps(pairs, indent=2))
-                f.write("\n")
-            elif fmt == "yaml":
-                if not HAS_YAML:
-                    console.print("[red]PyYAML is not installed. Install with: pip install pyyaml[/red]")
-                    return
-                yaml.dump(pairs, f, default_flow_style=False, sort_keys=True)
-            else:
-                for line in _format_export_lines(pairs, fmt):
-                    f.write(line + "\n")
-        console.print(f"[green]Exported {len(pairs)} secret(s) to {output}[/green]")
+        with Path(output).open("w") as f:
+            written = _write_export(f, pairs, fmt)
+        if written:
+            _console().print(f"[green]Exported {len(pairs)} secret(s) to {output}[/green]")
+    else:
+        _write_export(sys.stdout, pairs, fmt)
+
+
+def _write_export(stream: TextIO, pairs: dict[str, str], fmt: str) -> bool:
+    """Write key-ordered *pairs* to *stream* in *fmt*; False if YAML was requested but unavailable."""
+    if fmt == "json":
+        stream.write(json_dumps_pretty(pairs) + "\n")
+    elif fmt == "yaml":
+        yaml = _load_yaml()
+        if yaml is None:
+            _console().print("[red]PyYAML is not installed. Install with: pip install pyyaml[/red]")
+            return False
+        yaml.dump(pairs, stream, Dumper=_yaml_dumper(yaml), default_flow_style=False, sort_keys=False)
     else:
-        out = Console(file=sys.stdout, highlight=False)
-        if fmt == "json":
-            out.print(json.dumps(pairs, indent=2))
-        elif fmt == "yaml":
-            if not HAS_YAML:
-                console.print("[red]PyYAML is not installed. Install with: pip install pyyaml[/red]")
-                return
-            yaml.dump(pairs, sys.stdout, default_flow_style=False, sort_keys=True)
-        else:
-            for line in _format_export_lines(pairs, fmt):
-                out.print(line)
-
-
-def _shell_escape(value: str) -> str:
-    """Escape for Unix sh: single-quote wrapped, internal ' -> '\\''."""
-    if not value or any(c in value for c in " \t'\"\\$`!#&|;(){}"):
-        return "'" + value.replace("'", "'\\''") + "'"
-    return value
+        _write_lines(stream, _format_export_lines(pairs, fmt))
+    return True
+
+
+def _join_lines(lines: Iterable[str]) -> str:
+    """Newline-terminate and join *lines* so they go out in a single write."""
+    out = "\n".join(lines)
+    return out + "\n" if out else ""
+
+
+def _write_lines(stream: TextIO, lines: Iterable[str]) -> None:
+    """Stream newline-terminated *lines* into *stream*'s buffer as they are formatted.
+
+    Avoids materializing the whole export as one string; the text layer's
+    buffer still batches the underlying writes.
+    """
+    stream.writelines(f"{line}\n" for line in lines)
+
+
+def _yaml_dumper(yaml: ModuleType) -> Any:
+    """libyaml's C emitter when PyYAML was built with it, else the pure-Python safe dumper."""
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 def _powershell_escape(value: str) -> str:
     """Escape for PowerShell single-quoted string: ' -> ''."""
+    if "'" not in value:
+        return value
     return value.replace("'", "''")
 
 
-def _format_export_lines(pairs: dict[str, str], fmt: str) -> list[str]:
-    lines: list[str] = []
-    for key, value in sorted(pairs.items()):
-        if fmt == "dotenv":
-            lines.append(f"{key}={value}")
-        elif fmt == "unix":
-            lines.append(f"export {key}={_shell_escape(value)}")
-        elif fmt == "win":
-            lines.append(f"$env:{key} = '{_powershell_escape(value)}'")
-        else:
-            lines.append(f"{key}={value}")
-    return lines
+def _format_export_lines(pairs: dict[str, str], fmt: str) -> Iterator[str]:
+    """Lazily produce one export line per pair, in *pairs*' order (``export`` passes them key-sorted).
+
+    The format is chosen once, outside the loop; unknown formats fall back to dotenv.
+    """
+    items = pairs.items()
+    if fmt == "unix":
+        return (f"export {k}={_shell_escape(v)}" for k, v in items)
+    if fmt == "win":
+        return (f"$env:{k} = '{_powershell_escape(v)}'" for k, v in items)
+    return (f"{k}={v}" for k, v in items)
 
 
 # ---------------------------------------------------------------------------
 # unexport
 # ---------------------------------------------------------------------------
 
-@cli.command("unexport")
+@click.command("unexport")
 @click.option(
     "--format", "fmt",
     type=click.Choice(["unix", "win"]),
@@ -157,25 +161,23 @@ def unexport(ctx: click.Context, fmt: str) -> None:
     domain = ctx.obj["domain"]
     service = ctx.obj["service"]
 
-    keys_out: list[str] = []
+    keys_out: set[str] = set()
     store: SecretStore
     if service == "local" and domain is None:
-        global_store = KeychainStore(project=project)
+        global_store = _get_keychain(project, None)
         domains = global_store.list_domains() or ["_default_"]
         for d in domains:
-            store = _get_keychain(project, d)
-            for key in store.list_keys():
-                keys_out.append(key)
+            keys_out.update(_get_keychain(project, d).list_keys())
     else:
         store = _get_store(ctx)
-        use_export_name = service not in ("local", "file")
-        for key in store.list_keys():
-            out_key = key_to_export_name(store, key) if use_export_name else key
-            keys_out.append(out_key)
-
-    out = Console(file=sys.stdout, highlight=False)
-    for key in sorted(set(keys_out)):
-        if fmt == "win":
-            out.print(f"Remove-Item Env:{key} -ErrorAction SilentlyContinue")
-        else:
-            out.print(f"unset {key}")
+        keys = store.list_keys()
+        if service not in ("local", "file"):
+            keys = [key_to_export_name(store, key) for key in keys]
+        keys_out.update(keys)
+
+    # Sorted so unexport lists variables in the same order export wrote them.
+    if fmt == "win":
+        lines = (f"Remove-Item Env:{key} -ErrorAction SilentlyContinue" for key in sorted(keys_out))
+    else:
+        lines = (f"unset {key}" for key in sorted(keys_out))
+    sys.stdout.write(_join_lines(lines))
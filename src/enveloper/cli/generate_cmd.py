@@ -8,12 +8,11 @@ from __future__ import annotations
 import sys
 
 import click
-from rich.console import Console
 
-from enveloper.cli import _get_keychain, cli, common_options, console
+from enveloper.cli import _console, _get_keychain, common_options
 
 
-@cli.group()
+@click.group()
 def generate() -> None:
     """Generate configuration snippets."""
 
@@ -31,7 +30,7 @@ def gen_codebuild(ctx: click.Context, prefix: str | None) -> None:
     kc = _get_keychain(project, domain)
     keys = kc.list_keys()
     if not keys:
-        console.print("[yellow]No secrets to generate from.[/yellow]")
+        _console().print("[yellow]No secrets to generate from.[/yellow]")
         return
 
     resolved_prefix = prefix
@@ -42,8 +41,6 @@ def gen_codebuild(ctx: click.Context, prefix: str | None) -> None:
     if not resolved_prefix.endswith("/"):
         resolved_prefix += "/"
 
-    out = Console(file=sys.stdout, highlight=False)
-    out.print("env:")
-    out.print("  parameter-store:")
-    for key in sorted(keys):
-        out.print(f"    {key}: {resolved_prefix}{key}")
+    # Plain YAML with no markup: one pre-joined write, bypassing Rich's render pipeline.
+    body = "\n".join(f"    {key}: {resolved_prefix}{key}" for key in sorted(keys))
+    sys.stdout.write(f"env:\n  parameter-store:\n{body}\n")
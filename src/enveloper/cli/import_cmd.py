@@ -6,25 +6,58 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import click
 
 from enveloper.cli import (
-    HAS_YAML,
-    KeychainStore,
+    _console,
     _get_store,
-    cli,
+    _load_yaml,
     common_options,
-    console,
 )
-from enveloper.env_file import parse_env_file
+from enveloper.util import json_loads
 
-if HAS_YAML:
-    import yaml
+# domain -> project -> KEY is the deepest nesting import accepts.
+_MAX_DEPTH = 3
 
 
-@cli.command("import")
+def _flatten(data: dict[Any, Any], depth: int = 1) -> Iterator[tuple[int, str, str]]:
+    """Yield ``(depth, KEY, str(value))`` for every leaf of a nested domain/project mapping."""
+    for k, v in data.items():
+        if not isinstance(v, dict):
+            yield depth, str(k), str(v)
+        elif depth < _MAX_DEPTH:
+            yield from _flatten(v, depth + 1)
+        else:
+            raise click.ClickException(
+                f"Value for {k!r} is nested too deeply; expected at most domain -> project -> KEY."
+            )
+
+
+def _flatten_pairs(data: dict[Any, Any]) -> dict[str, str]:
+    """Flatten *data* to ``{KEY: value}``, rejecting mixed nesting and keys repeated across scopes."""
+    pairs: dict[str, str] = {}
+    shape = None
+    for depth, key, value in _flatten(data):
+        if shape is None:
+            shape = depth
+        elif depth != shape:
+            raise click.ClickException(
+                f"Key {key!r} is nested {depth} level(s) deep but earlier keys are nested {shape}; "
+                "use one shape throughout (KEY, domain -> KEY, or domain -> project -> KEY)."
+            )
+        if key in pairs:
+            raise click.ClickException(
+                f"Key {key!r} appears in more than one domain/project; import them separately."
+            )
+        pairs[key] = value
+    return pairs
+
+
+@click.command("import")
 @click.argument("file", required=False, type=click.Path(exists=False))
 @click.option(
     "--format", "fmt",
@@ -60,55 +93,32 @@ def import_env(ctx: click.Context, file: str | None, fmt: str) -> None:
         raise click.BadParameter(f"File not found: {file}", param_hint="FILE")
 
     if fmt == "env":
+        from enveloper.env_file import parse_env_file
+
         pairs = parse_env_file(path)
     else:
         if fmt == "json":
             try:
-                content = path.read_text()
-                data = json.loads(content)
+                data = json_loads(path.read_bytes())
             except json.JSONDecodeError as e:
                 raise click.ClickException(f"Invalid JSON file: {e}")
         else:
-            if not HAS_YAML:
+            yaml = _load_yaml()
+            if yaml is None:
                 raise click.ClickException(
                     "PyYAML is not installed. Install with: pip install pyyaml"
                 )
+
+            # libyaml's C loader when PyYAML was built with it; same safe subset either way.
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
             try:
-                content = path.read_text()
-                data = yaml.safe_load(content)
+                with path.open("rb") as f:
+                    data = yaml.load(f, Loader=loader)
             except yaml.YAMLError as e:
                 raise click.ClickException(f"Invalid YAML file: {e}")
 
-        pairs = {}
         if isinstance(data, dict):
-            has_domains = False
-            has_projects = False
-
-            for k, v in data.items():
-                if isinstance(v, dict):
-                    for pk, pv in v.items():
-                        if isinstance(pv, dict):
-                            has_projects = True
-                        else:
-                            has_domains = True
-                        break
-                    break
-
-            if has_projects:
-                for d_name, d_content in data.items():
-                    if isinstance(d_content, dict):
-                        for p_name, p_content in d_content.items():
-                            if isinstance(p_content, dict):
-                                for k, v in p_content.items():
-                                    pairs[k] = str(v)
-            elif has_domains:
-                for d_name, d_content in data.items():
-                    if isinstance(d_content, dict):
-                        for k, v in d_content.items():
-                            pairs[k] = str(v)
-            else:
-                for k, v in data.items():
-                    pairs[k] = str(v)
+            pairs = _flatten_pairs(data)
         elif isinstance(data, list):
             raise click.ClickException(
                 f"{fmt.upper()} file must contain an object/dictionary, not a list."
@@ -119,16 +129,17 @@ def import_env(ctx: click.Context, file: str | None, fmt: str) -> None:
             )
 
     if not pairs:
-        console.print(f"[yellow]No variables found in {file}[/yellow]")
+        _console().print(f"[yellow]No variables found in {file}[/yellow]")
         return
 
+    from enveloper.stores.keychain import KeychainStore
+
     store = _get_store(ctx)
-    for key, value in pairs.items():
-        if isinstance(store, KeychainStore):
-            store.set_with_domain_tracking(key, value)
-        else:
-            store.set(key, value)
+    if isinstance(store, KeychainStore):
+        store.set_many_with_domain_tracking(pairs)
+    else:
+        store.set_many(pairs)
 
-    console.print(
+    _console().print(
         f"[green]Imported {len(pairs)} variable(s) from {file}[/green]"
     )
@@ -9,10 +9,10 @@ from pathlib import Path
 
 import click
 
-from enveloper.cli import cli, common_options, console
+from enveloper.cli import _console, common_options
 
 
-@cli.command()
+@click.command()
 @common_options
 def init(ctx: click.Context) -> None:
     """Configure the OS keychain for frictionless access.
@@ -23,6 +23,7 @@ def init(ctx: click.Context) -> None:
     import shutil
     import subprocess
 
+    console = _console()
     system = platform.system()
 
     if system == "Darwin":
@@ -6,74 +6,70 @@
 from __future__ import annotations
 
 import click
-from rich.table import Table
 
 from enveloper.cli import (
-    KeychainStore,
     SecretStore,
+    _console,
     _get_keychain,
     _get_store,
     _mask,
-    cli,
+    _print_table,
     common_options,
-    console,
     key_to_export_name,
 )
 
 
-@cli.command("list")
+@click.command("list")
 @common_options
 def list_keys(ctx: click.Context) -> None:
-    """List stored secret key names."""
+    """List stored secret key names.
+
+    On a terminal this draws a table; when stdout is piped it writes one
+    tab-separated row per secret instead.
+    """
     project = ctx.obj["project"]
     domain = ctx.obj["domain"]
     service = ctx.obj["service"]
     store: SecretStore
+    mask = _mask
 
     if service == "local" and domain is None:
-        global_store = KeychainStore(project=project)
+        global_store = _get_keychain(project, None)
         domains_to_show = global_store.list_domains() or ["_default_"]
         if not domains_to_show:
-            console.print("[yellow]No secrets stored.[/yellow]")
+            _console().print("[yellow]No secrets stored.[/yellow]")
             return
-        table = Table(title=f"Secrets for project '{project}'")
-        table.add_column("Project", style="cyan")
-        table.add_column("Domain", style="cyan")
-        table.add_column("Version", style="cyan")
-        table.add_column("Key", style="white")
-        table.add_column("Value (masked)", style="dim")
-        has_secrets = False
-        for d in sorted(domains_to_show):
-            store = _get_keychain(project, d)
-            keys = store.list_keys()
-            if not keys:
-                table.add_row(project, d, "(empty)", "(empty)", "(empty)")
-                has_secrets = True
-                continue
-            for key in sorted(keys):
-                val = store.get(key)
-                masked = _mask(val) if val else "(empty)"
-                table.add_row(project, d, store._version, key, masked)
-                has_secrets = True
-        if not has_secrets:
-            console.print("[yellow]No secrets stored.[/yellow]")
+        by_domain = global_store.read_domains(domains_to_show)
+        version = global_store._version
+        rows = [
+            (project, d, version, key, mask(val) if val else "(empty)")
+            for d, entries in by_domain.items()
+            for key, val in entries
+        ]
+        rows.extend((project, d, "(empty)", "(empty)", "(empty)") for d, entries in by_domain.items() if not entries)
+        # One sort over the flat rows orders by domain, then key (project is constant).
+        rows.sort()
+        if not rows:
+            _console().print("[yellow]No secrets stored.[/yellow]")
             return
-        console.print(table)
+        _print_table(
+            f"Secrets for project '{project}'",
+            [("Project", "cyan"), ("Domain", "cyan"), ("Version", "cyan"), ("Key", "white"), ("Value (masked)", "dim")],
+            rows,
+        )
     else:
         store = _get_store(ctx)
-        keys = store.list_keys()
-        keys_with_values = [(k, store.get(k)) for k in keys]
-        keys_to_show = [(k, v) for k, v in keys_with_values if v is not None]
+        keys_to_show = list(store.items().items())
         title = f"Secrets ({service})"
         if service == "file":
             title = f"Secrets (file: {ctx.obj['path']})"
-        table = Table(title=title)
-        table.add_column("Key", style="white")
-        table.add_column("Value (masked)", style="dim")
+        masked_rows: list[tuple[str, str]]
         if not keys_to_show:
-            table.add_row("(empty)", "(empty)")
+            masked_rows = [("(empty)", "(empty)")]
         else:
-            for key, val in sorted(keys_to_show, key=lambda x: x[0]):
-                display_key = key_to_export_name(store, key) if service not in ("local", "file") else key
-                table.add_row(display_key, _mask(val))
-        console.print(table)
+            keys_to_show.sort()
+            if service in ("local", "file"):
+                masked_rows = [(key, mask(val)) for key, val in keys_to_show]
+            else:
+                masked_rows = [(key_to_export_name(store, key), mask(val)) for key, val in keys_to_show]
+        _print_table(title, [("Key", "white"), ("Value (masked)", "dim")], masked_rows)
@@ -5,26 +5,170 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain
+
 import click
 
 from enveloper.cli import (
-    GitHubStore,
-    KeychainStore,
+    SecretStore,
+    _console,
     _get_store,
     _make_cloud_store,
-    cli,
     common_options,
-    console,
-    key_to_export_name,
 )
 
+# Default for --max-parallel: concurrent requests per store during push/pull.
+DEFAULT_MAX_PARALLEL = 10
+
+# --verbose key listings are printed in chunks of this many lines.
+_VERBOSE_CHUNK = 1024
+
+# Exception messages in the failed-keys table are cut to this many characters.
+_ERROR_WIDTH = 80
+
+_max_parallel_option = click.option(
+    "--max-parallel", default=DEFAULT_MAX_PARALLEL, show_default=True, type=click.IntRange(min=1),
+    help="Maximum concurrent get/set requests per store (stores that are not thread-safe run serially).",
+)
+
+
+def _peek(items: Iterator[tuple[str, str]]) -> Iterator[tuple[str, str]] | None:
+    """Return *items* with its first pair pushed back, or ``None`` if it is empty."""
+    first = next(items, None)
+    return None if first is None else chain((first,), items)
+
+
+def _until_read_error(
+    items: Iterable[tuple[str, str]], errors: list[Exception],
+) -> Iterator[tuple[str, str]]:
+    """Yield from *items* until it is exhausted or raises; a raised error is appended to *errors*.
+
+    Lets the writers finish every pair read so far when the source fails
+    partway (e.g. a throttled SSM page), instead of the exception escaping
+    mid-copy.
+    """
+    it = iter(items)
+    while True:
+        try:
+            kv = next(it)
+        except StopIteration:
+            return
+        except Exception as e:
+            errors.append(e)
+            return
+        yield kv
+
+
+def _print_read_error(err: Exception, source: str, written: int, failed: int) -> None:
+    """Report that reading *source* stopped early, with the counts of what was copied."""
+    from rich.markup import escape
+
+    msg = str(err) or type(err).__name__
+    _console().print(
+        f"[red]Reading from {escape(source)} failed: {escape(msg)}[/red]\n"
+        f"  {written} secret(s) written and {failed} failed before the error; re-run to copy the rest."
+    )
+
+
+def _print_keys(writes: list[tuple[str, str]]) -> None:
+    """Print the written keys for --verbose, one stderr write per chunk of lines.
+
+    Plain ``click.echo``: key names are not run through Rich's markup parser,
+    so a key containing ``[`` prints verbatim.
+    """
+    for i in range(0, len(writes), _VERBOSE_CHUNK):
+        click.echo("\n".join(f"  {key}" for key, _ in writes[i:i + _VERBOSE_CHUNK]), err=True)
+
+
+def _write_all(
+    set_value: Callable[[str, str], None], writes: Iterable[tuple[str, str]], max_workers: int,
+) -> tuple[list[tuple[str, str]], list[tuple[str, Exception]]]:
+    """Apply every write, collecting per-key failures instead of stopping at the first.
+
+    Each write is submitted as soon as *writes* yields it, so a streaming
+    source (e.g. an SSM ``GetParametersByPath`` page) overlaps its reads with
+    the target's writes. The first write runs on the calling thread so the
+    target's lazily created client exists before the pool touches it.
+
+    Returns ``(written, failed)`` in input order so a re-run after a transient
+    error converges instead of restarting from scratch.
+    """
+    def attempt(kv: tuple[str, str]) -> Exception | None:
+        try:
+            set_value(*kv)
+        except Exception as e:
+            return e
+        return None
 
-@cli.command()
+    it = iter(writes)
+    first = next(it, None)
+    if first is None:
+        return [], []
+    results = [(first, attempt(first))]
+    if max_workers <= 1:
+        results.extend((kv, attempt(kv)) for kv in it)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [(kv, pool.submit(attempt, kv)) for kv in it]
+        results.extend((kv, future.result()) for kv, future in futures)
+    written = [kv for kv, err in results if err is None]
+    failed = [(kv[0], err) for kv, err in results if err is not None]
+    return written, failed
+
+
+def _write_batch(
+    set_many: Callable[[dict[str, str]], None],
+    set_value: Callable[[str, str], None],
+    writes: Iterable[tuple[str, str]],
+) -> tuple[list[tuple[str, str]], list[tuple[str, Exception]]]:
+    """Apply every write with one ``set_many`` call; same return shape as :func:`_write_all`.
+
+    For stores that are not thread-safe because each ``set`` rewrites a shared
+    record (Vault secret, .env file, keychain manifest); ``set_many`` does that
+    once. If the batch raises, the pairs are retried one at a time so the
+    failure table still names the keys that could not be written.
+    """
+    batch = dict(writes)
+    if not batch:
+        return [], []
+    try:
+        set_many(batch)
+    except Exception:
+        return _write_all(set_value, batch.items(), 1)
+    return list(batch.items()), []
+
+
+def _print_failures(failed: list[tuple[str, Exception]]) -> None:
+    """Print a table of keys that could not be written, with truncated error messages."""
+    from rich.markup import escape
+    from rich.table import Table
+
+    table = Table(title=f"Failed to write {len(failed)} secret(s)")
+    table.add_column("Key", style="cyan")
+    table.add_column("Error", style="red")
+    for key, err in failed:
+        msg = str(err) or type(err).__name__
+        if len(msg) > _ERROR_WIDTH:
+            msg = msg[:_ERROR_WIDTH - 3] + "..."
+        table.add_row(escape(key), escape(msg))
+    _console().print(table)
+
+
+def _workers(store: SecretStore, max_parallel: int) -> int:
+    """Thread count for I/O against *store*: *max_parallel*, or 1 if it is not thread-safe."""
+    return max_parallel if store.thread_safe else 1
+
+
+@click.command()
 @click.option("--from", "from_service", default="local", help="Source service to push from (default: local).")
 @click.option("--prefix", default=None, help="Key prefix for the target store.")
 @click.option("--profile", default=None, help="AWS profile (aws store).")
 @click.option("--region", default=None, help="AWS region (aws store).")
 @click.option("--repo", default=None, help="GitHub repo owner/name (github store).")
+@_max_parallel_option
 @common_options
 def push(
     ctx: click.Context,
@@ -33,61 +177,76 @@ def push(
     profile: str | None,
     region: str | None,
     repo: str | None,
+    max_parallel: int,
 ) -> None:
     """Push secrets to a cloud store. Use global --service to specify the cloud store (e.g. --service aws)."""
-    cloud_store = ctx.obj["service"]
+    obj = ctx.obj
+    cloud_store = obj["service"]
     if cloud_store in ("local", "file"):
         raise click.UsageError("Push target must be a cloud store. Use --service aws, github, vault, gcp, azure, or aliyun.")
-    domain = ctx.obj["domain_resolved"]
-    cfg = ctx.obj["config"]
-    env_name = ctx.obj["env_name"]
-    path = ctx.obj.get("path", ".env")
-
-    orig_service = ctx.obj["service"]
-    ctx.obj["service"] = from_service
-    ctx.obj["path"] = path
+    domain = obj["domain_resolved"]
+    cfg = obj["config"]
+    env_name = obj["env_name"]
+    path = obj.get("path", ".env")
+    project = obj["project"]
+    verbose = obj["verbose"]
+
+    orig_service = obj["service"]
+    obj["service"] = from_service
+    obj["path"] = path
     try:
         source = _get_store(ctx)
     finally:
-        ctx.obj["service"] = orig_service
-    keys = source.list_keys()
-    if not keys:
-        console.print("[yellow]No secrets to push.[/yellow]")
+        obj["service"] = orig_service
+    items = _peek(source.iter_items(_workers(source, max_parallel)))
+    if items is None:
+        _console().print("[yellow]No secrets to push.[/yellow]")
         return
 
     target = _make_cloud_store(
-        cloud_store, cfg, ctx.obj["project"], domain, env_name,
+        cloud_store, cfg, project, domain, env_name,
         prefix=prefix, profile=profile, region=region, repo=repo,
     )
 
-    source_version = getattr(source, "_version", None) or ctx.obj.get("version") or "1.0.0"
-    project = ctx.obj["project"] or "_default_"
-    domain = ctx.obj["domain_resolved"]
-
-    count = 0
-    for key in keys:
-        val = source.get(key)
-        if val is not None:
-            name = key_to_export_name(source, key)
-            if isinstance(target, GitHubStore):
-                target.set(name, val)
-                if ctx.obj["verbose"]:
-                    console.print(f"  {name}")
-            else:
-                target_key = target.build_key(name=name, project=project, domain=domain, version=source_version)
-                target.set(target_key, val)
-                if ctx.obj["verbose"]:
-                    console.print(f"  {target_key}")
-            count += 1
-
-    console.print(f"[green]Pushed {count} secret(s) to {cloud_store}[/green]")
-
-
-@cli.command()
+    from enveloper.stores.github import GitHubStore
+
+    source_version = getattr(source, "_version", None) or obj.get("version") or "1.0.0"
+    project = project or "_default_"
+
+    read_errors: list[Exception] = []
+    items = _until_read_error(items, read_errors)
+    export_name = source.key_to_export_name
+    # GitHub secrets take plain names; other stores get full composite keys.
+    if isinstance(target, GitHubStore):
+        writes = ((export_name(key), val) for key, val in items)
+    else:
+        build_key = target.build_key
+        writes = (
+            (build_key(name=export_name(key), project=project, domain=domain, version=source_version), val)
+            for key, val in items
+        )
+    if target.thread_safe:
+        written, failed = _write_all(target.set, writes, max_parallel)
+    else:
+        written, failed = _write_batch(target.set_many, target.set, writes)
+    if verbose:
+        _print_keys(written)
+
+    _console().print(f"[green]Pushed {len(written)} secret(s) to {cloud_store}[/green]")
+    if failed:
+        _print_failures(failed)
+    if read_errors:
+        _print_read_error(read_errors[0], from_service, len(written), len(failed))
+    if failed or read_errors:
+        ctx.exit(1)
+
+
+@click.command()
 @click.option("--to", "to_service", default="local", help="Target service to pull into (default: local).")
 @click.option("--prefix", default=None, help="Key prefix on the source store.")
 @click.option("--profile", default=None, help="AWS profile (aws store).")
 @click.option("--region", default=None, help="AWS region (aws store).")
+@_max_parallel_option
 @common_options
 def pull(
     ctx: click.Context,
@@ -95,43 +254,55 @@ def pull(
     prefix: str | None,
     profile: str | None,
     region: str | None,
+    max_parallel: int,
 ) -> None:
     """Pull secrets from a cloud store. Use global --service to specify the cloud store (e.g. --service aws)."""
-    cloud_store = ctx.obj["service"]
+    obj = ctx.obj
+    cloud_store = obj["service"]
     if cloud_store in ("local", "file"):
         raise click.UsageError("Pull source must be a cloud store. Use --service aws, vault, gcp, azure, or aliyun.")
-    domain = ctx.obj["domain_resolved"]
-    cfg = ctx.obj["config"]
-    env_name = ctx.obj["env_name"]
-    path = ctx.obj.get("path", ".env")
+    domain = obj["domain_resolved"]
+    cfg = obj["config"]
+    env_name = obj["env_name"]
+    path = obj.get("path", ".env")
+    verbose = obj["verbose"]
     source = _make_cloud_store(
-        cloud_store, cfg, ctx.obj["project"], domain, env_name,
+        cloud_store, cfg, obj["project"], domain, env_name,
         prefix=prefix, profile=profile, region=region,
     )
 
-    keys = source.list_keys()
-    if not keys:
-        console.print("[yellow]No secrets found in remote store.[/yellow]")
+    items = _peek(source.iter_items(_workers(source, max_parallel)))
+    if items is None:
+        _console().print("[yellow]No secrets found in remote store.[/yellow]")
         return
 
-    orig_service = ctx.obj["service"]
-    ctx.obj["service"] = to_service
-    ctx.obj["path"] = path
+    orig_service = obj["service"]
+    obj["service"] = to_service
+    obj["path"] = path
     try:
         target = _get_store(ctx)
     finally:
-        ctx.obj["service"] = orig_service
-    count = 0
-    for key in keys:
-        val = source.get(key)
-        if val is not None:
-            local_key = key_to_export_name(source, key)
-            if isinstance(target, KeychainStore):
-                target.set_with_domain_tracking(local_key, val)
-            else:
-                target.set(local_key, val)
-            count += 1
-            if ctx.obj["verbose"]:
-                console.print(f"  {local_key}")
-
-    console.print(f"[green]Pulled {count} secret(s) from {cloud_store}[/green]")
+        obj["service"] = orig_service
+    from enveloper.stores.keychain import KeychainStore
+
+    if isinstance(target, KeychainStore):
+        set_value, set_many = target.set_with_domain_tracking, target.set_many_with_domain_tracking
+    else:
+        set_value, set_many = target.set, target.set_many
+    read_errors: list[Exception] = []
+    export_name = source.key_to_export_name
+    writes = ((export_name(key), val) for key, val in _until_read_error(items, read_errors))
+    if target.thread_safe:
+        written, failed = _write_all(set_value, writes, max_parallel)
+    else:
+        written, failed = _write_batch(set_many, set_value, writes)
+    if verbose:
+        _print_keys(written)
+
+    _console().print(f"[green]Pulled {len(written)} secret(s) from {cloud_store}[/green]")
+    if failed:
+        _print_failures(failed)
+    if read_errors:
+        _print_read_error(read_errors[0], cloud_store, len(written), len(failed))
+    if failed or read_errors:
+        ctx.exit(1)
@@ -5,18 +5,42 @@
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING
+
 import click
-from rich.table import Table
 
-from enveloper.cli import _doc_link, cli, common_options, console, get_service_entries
+from enveloper.cli import _console, _doc_link, _print_table, common_options
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
+
+# Horizontal rules separating local, file and cloud rows in the service table.
+_SEPARATOR_ROW = ("─" * 12, "─" * 36, "─" * 11)
+
 
+@functools.cache
+def _service_rows() -> tuple[tuple[tuple[str, str, Text | str], bool], ...]:
+    """``((short_name, display_name, doc_cell), separator_before)`` for every service row.
 
-def _service_table_separator_row() -> tuple[str, str, str]:
-    """Return a row of horizontal rules for visual separation in the service table."""
-    return ("─" * 12, "─" * 36, "─" * 11)
+    Store metadata is static, so the entry-point walk and the hyperlink cells
+    are built once per process.
+    """
+    from enveloper.stores import get_service_entries
+
+    rows: list[tuple[tuple[str, str, Text | str], bool]] = []
+    prev_entry: str | None = None
+    for entry_name, store_cls in get_service_entries():
+        separator = prev_entry in ("keychain", "file")
+        for short_name, display_name, doc_url in store_cls.get_service_rows():
+            rows.append(((short_name, display_name, _doc_link(doc_url) if doc_url else ""), separator))
+            separator = False
+        prev_entry = entry_name
+    return tuple(rows)
 
 
-@cli.command("service")
+@click.command("service")
 @common_options
 def service_list(ctx: click.Context) -> None:
     """List all available service providers in a table (local, file, then cloud stores).
@@ -24,35 +48,28 @@ def service_list(ctx: click.Context) -> None:
     Each store provides its short name, description, and documentation link
     via class attributes and get_service_rows().
     """
+    from rich.table import Table
+
     table = Table(title="Service providers")
     table.add_column("Service", style="cyan")
     table.add_column("Description", style="white")
     table.add_column("Documentation", style="dim")
-    prev_entry: str | None = None
-    for entry_name, store_cls in get_service_entries():
-        if prev_entry == "keychain":
-            table.add_row(*_service_table_separator_row(), style="dim")
-        elif prev_entry == "file":
-            table.add_row(*_service_table_separator_row(), style="dim")
-        for short_name, display_name, doc_url in store_cls.get_service_rows():
-            doc_cell = _doc_link(doc_url) if doc_url else ""
-            table.add_row(short_name, display_name, doc_cell)
-        prev_entry = entry_name
-    console.print(table)
-    console.print("[yellow]Note: To open documentation links, you may need to Command-Click on them.[/yellow]")
+    for row, separator_before in _service_rows():
+        if separator_before:
+            table.add_row(*_SEPARATOR_ROW, style="dim")
+        table.add_row(*row)
+    _console().print(table)
+    _console().print("[yellow]Note: To open documentation links, you may need to Command-Click on them.[/yellow]")
 
 
-@cli.command()
+@click.command()
 @common_options
 def stores(ctx: click.Context) -> None:
-    """List available store plugins."""
-    table = Table(title="Available Stores")
-    table.add_column("Name", style="cyan")
-    table.add_column("Module", style="dim")
-
-    from importlib.metadata import entry_points as _eps
-
-    for ep in sorted(_eps(group="enveloper.stores"), key=lambda e: e.name):
-        table.add_row(ep.name, ep.value)
+    """List available store plugins (tab-separated name and module when piped)."""
+    from enveloper.stores import list_store_entry_points
 
-    console.print(table)
+    _print_table(
+        "Available Stores",
+        [("Name", "cyan"), ("Module", "dim")],
+        [(ep.name, ep.value) for ep in list_store_entry_points()],
+    )
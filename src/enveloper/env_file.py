@@ -32,16 +32,19 @@ _LINE_RE = re.compile(
 def parse_env_file(path: str | Path) -> dict[str, str]:
     """Read a .env file and return an ordered dict of key-value pairs."""
     result: dict[str, str] = {}
-    for line in Path(path).read_text().splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        m = _LINE_RE.match(stripped)
-        if m is None:
-            continue
-        key = m.group(1)
-        raw = m.group(2).strip()
-        result[key] = _unquote(raw)
+    # Iterate the file object so only one line is held at a time, not a full
+    # copy of the text plus a list of its lines.
+    with Path(path).open() as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            m = _LINE_RE.match(stripped)
+            if m is None:
+                continue
+            key = m.group(1)
+            raw = m.group(2).strip()
+            result[key] = _unquote(raw)
     return result
 
 
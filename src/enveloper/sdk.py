@@ -93,14 +93,8 @@ def _load_from_ssm(domain: str, cfg: EnveloperConfig, version: str | None = None
             region=cfg.aws_region or os.environ.get("AWS_REGION"),
             version=version or "1.0.0",
         )
-        keys = store.list_keys()
-        result: dict[str, str] = {}
-        for key in keys:
-            value = store.get(key)
-            if value is not None:
-                out_key = key_to_export_name(store, key)
-                result[out_key] = value
-        return result
+        # One paginated GetParametersByPath listing returns the values too; no per-key reads.
+        return {key_to_export_name(store, key): value for key, value in store.iter_items()}
     except Exception:
         return {}
 
@@ -123,11 +117,8 @@ def _collect_secrets(
         # Single store: file or cloud
         store = get_store(service, project, domain, cfg, path=path, env_name=env_name, version=version_str)
         strip_prefix = service not in ("file",)  # strip prefix/version when loading from cloud
-        for key in store.list_keys():
-            value = store.get(key)
-            if value is not None:
-                out_key = key_to_export_name(store, key) if strip_prefix else key
-                merged[out_key] = value
+        for key, value in store.iter_items():
+            merged[key_to_export_name(store, key) if strip_prefix else key] = value
         if include_os_environ:
             for k, v in os.environ.items():
                 if k not in merged and v is not None:
@@ -139,11 +130,7 @@ def _collect_secrets(
     merged.update(ssm_values)
 
     store = KeychainStore(project=project, domain=domain, version=version_str)
-    for key in store.list_keys():
-        if key not in merged:
-            value = store.get(key)
-            if value is not None:
-                merged[key] = value
+    merged.update(store.bulk_get([key for key in store.list_keys() if key not in merged]))
 
     if include_os_environ:
         for key, value in os.environ.items():
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from typing import TypeVar
 
 # Default namespace used when project/domain are not provided (reserved name).
@@ -19,6 +20,9 @@ DEFAULT_VERSION: str = "1.0.0"
 # Default prefix for cloud stores
 DEFAULT_PREFIX: str = "envr"
 
+# Worker cap for thread-pooled store I/O (bulk_get, clear, CLI import)
+MAX_WORKERS: int = 16
+
 # Regex pattern for valid semver version
 _SEMVER_PATTERN = re.compile(
     r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
@@ -33,6 +37,26 @@ def is_valid_semver(version: str) -> bool:
 
 
 SecretStoreT = TypeVar("SecretStoreT", bound="SecretStore")
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def map_concurrently(fn: Callable[[_T], _R], items: Iterable[_T], max_workers: int = MAX_WORKERS) -> list[_R]:
+    """Return ``[fn(item) for item in items]``, overlapping the calls in a thread pool.
+
+    The first item runs on the calling thread so lazily created clients
+    (boto3, hvac, ...) exist before other threads touch them. Exceptions
+    propagate as they would from the plain loop. ``max_workers <= 1`` runs
+    everything serially on the calling thread.
+    """
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [fn(item) for item in items]
+    first = fn(items[0])
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items) - 1)) as pool:
+        return [first, *pool.map(fn, items[1:])]
 
 
 class SecretStore(ABC):
@@ -68,6 +92,11 @@ class SecretStore(ABC):
       Default is "/". The sanitize_key_segment method ensures this character
       is not present in name, domain, or project values.
 
+    - ``thread_safe`` (class attribute, bool): whether :meth:`get`,
+      :meth:`set` and :meth:`delete` may run concurrently from several
+      threads. Default ``True``; the CLI then overlaps per-key round-trips.
+      Set ``False`` when each write rewrites shared state.
+
     **Service listing** (for ``enveloper service``): each store must define
     ``service_name`` (short CLI name, e.g. ``"aws"``), ``service_display_name``
     (human-readable description), and ``service_doc_url`` (documentation link).
@@ -92,6 +121,10 @@ class SecretStore(ABC):
     # Prefix for cloud stores (default: "envr")
     prefix: str = DEFAULT_PREFIX
 
+    # False when get/set/delete must not overlap across threads, e.g. stores that
+    # read-modify-write one shared file, manifest, or secret on every change
+    thread_safe: bool = True
+
     # Service listing (enveloper service): short name, display name, doc link
     service_name: str = ""
     service_display_name: str = ""
@@ -137,12 +170,59 @@ class SecretStore(ABC):
     def list_keys(self) -> list[str]:
         """Return all key names managed by this store."""
 
+    def bulk_get(self, keys: Iterable[str], max_workers: int = MAX_WORKERS) -> dict[str, str]:
+        """Return ``{key: value}`` for each of *keys* that exists; missing keys are omitted.
+
+        The default issues :meth:`get` calls from a pool of up to *max_workers*
+        threads so network-backed stores overlap their round-trips. Subclasses
+        with a batch read API, or with cheap local reads, should override (and
+        may ignore *max_workers*).
+        """
+        keys = list(keys)
+        values = map_concurrently(self.get, keys, max_workers)
+        return {k: v for k, v in zip(keys, values) if v is not None}
+
+    def items(self) -> dict[str, str]:
+        """Return every ``{key: value}`` this store holds (keys as from :meth:`list_keys`).
+
+        Default: :meth:`bulk_get` over :meth:`list_keys`. Stores that can read
+        everything in one call should override.
+        """
+        return self.bulk_get(self.list_keys())
+
+    def iter_items(self, max_workers: int = MAX_WORKERS) -> Iterator[tuple[str, str]]:
+        """Yield ``(key, value)`` pairs for every secret, streaming where the backend allows.
+
+        Default: :meth:`bulk_get` over :meth:`list_keys`. Stores whose listing
+        API returns values alongside names should override to yield straight
+        from the listing and skip the separate reads.
+        """
+        yield from self.bulk_get(self.list_keys(), max_workers).items()
+
+    def set_many(self, pairs: Mapping[str, str], max_workers: int = MAX_WORKERS) -> None:
+        """Store every ``key -> value`` in *pairs*.
+
+        The default calls :meth:`set` for each pair, from a pool of up to
+        *max_workers* threads when :attr:`thread_safe` is true and serially
+        otherwise. Stores that keep many keys in one record (a file, a Vault
+        secret) should override to read and write that record once.
+        """
+        if self.thread_safe:
+            map_concurrently(lambda kv: self.set(*kv), pairs.items(), max_workers)
+            return
+        for key, value in pairs.items():
+            self.set(key, value)
+
     def clear(self) -> None:
         """Remove every key managed by this store (default: delete each key from list_keys).
 
         Used by the CLI when the user runs ``enveloper clear --service <name>``.
-        Subclasses may override for a more efficient bulk clear.
+        Deletes run concurrently when :attr:`thread_safe` is true. Subclasses
+        may override for a more efficient bulk clear.
         """
+        if self.thread_safe:
+            map_concurrently(self.delete, self.list_keys())
+            return
         for key in self.list_keys():
             self.delete(key)
 
@@ -244,13 +324,14 @@ class SecretStore(ABC):
         When exporting to a .env or similar file, use this so output has plain
         names like API_KEY rather than envr/domain/proj/1.0.0/API_KEY.
         """
+        if self.key_separator not in key:
+            # Already a plain name (keychain/file keys): nothing to parse or strip.
+            return key
         parsed = self.parse_key(key)
         if parsed:
             return parsed["name"]
         # Fallback: strip by separator (e.g. last segment after /)
-        if self.key_separator in key:
-            return key.rsplit(self.key_separator, 1)[-1]
-        return key
+        return key.rsplit(self.key_separator, 1)[-1]
 
     @classmethod
     def from_config(
@@ -5,8 +5,12 @@
 
 from __future__ import annotations
 
+import functools
+import operator
+import os
 import sys
 from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
 from enveloper.store import SecretStore
 from enveloper.stores.file_store import FileStore
@@ -17,6 +21,63 @@ if sys.version_info >= (3, 12):
 else:
     from importlib.metadata import entry_points
 
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+
+_GROUP = "enveloper.stores"
+
+
+def _entry_points_cache_names() -> tuple[str, str]:
+    """Return ``(file name, stale glob)`` for the on-disk entry-point cache.
+
+    The key covers the interpreter prefix, Python version and the mtime of every
+    ``sys.path`` directory, so installing or removing a distribution (which adds
+    or drops a ``*.dist-info`` entry) invalidates it.
+    """
+    import hashlib
+
+    stamps = []
+    for entry in sys.path:
+        try:
+            stamps.append((entry, os.stat(entry or ".").st_mtime_ns))
+        except OSError:
+            continue
+    prefix = hashlib.sha1(sys.prefix.encode()).hexdigest()[:12]
+    key = hashlib.sha1(repr((sys.version_info[:2], stamps)).encode()).hexdigest()[:16]
+    return f"eps-{prefix}-{key}.json", f"eps-{prefix}-*.json"
+
+
+@functools.cache
+def list_store_entry_points() -> tuple[EntryPoint, ...]:
+    """Return the ``enveloper.stores`` entry points, sorted by name.
+
+    Scanning installed distributions' metadata is slow in large environments,
+    so the scan runs once per process and its result is persisted under
+    ``cache_dir()`` keyed by ``sys.path`` mtimes (skipped when
+    ``ENVELOPER_NO_CACHE`` is set). Call ``list_store_entry_points.cache_clear()``
+    after installing a plugin in the same process.
+    """
+    import json
+    from importlib.metadata import EntryPoint
+
+    from enveloper.util import cache_dir, write_cache_file
+
+    use_disk = not os.environ.get("ENVELOPER_NO_CACHE")
+    if use_disk:
+        name, stale_glob = _entry_points_cache_names()
+        try:
+            pairs = json.loads((cache_dir() / name).read_text(encoding="utf-8"))
+            return tuple(EntryPoint(ep_name, value, _GROUP) for ep_name, value in pairs)
+        except (OSError, ValueError, TypeError):
+            pass
+
+    eps = tuple(sorted(entry_points(group=_GROUP), key=operator.attrgetter("name")))
+    if use_disk:
+        data = json.dumps([[ep.name, ep.value] for ep in eps]).encode()
+        write_cache_file(name, data, stale_glob=stale_glob)
+    return eps
+
 
 def get_service_entries() -> Iterator[tuple[str, type[SecretStore]]]:
     """Yield (entry_name, store_class) in display order for ``enveloper service``.
@@ -25,9 +86,10 @@ def get_service_entries() -> Iterator[tuple[str, type[SecretStore]]]:
     """
     yield "keychain", KeychainStore
     yield "file", FileStore
-    for name in sorted(list_store_names()):
-        if name != "keychain":
-            yield name, get_store_class(name)
+    # list_store_entry_points() is already sorted by name and cached; no re-sort.
+    for ep in list_store_entry_points():
+        if ep.name != "keychain":
+            yield ep.name, ep.load()
 
 
 def get_store_class(name: str) -> type[SecretStore]:
@@ -35,12 +97,12 @@ def get_store_class(name: str) -> type[SecretStore]:
 
     Raises ``KeyError`` with a helpful message when the name is unknown.
     """
-    eps = entry_points(group="enveloper.stores")
+    eps = list_store_entry_points()
     for ep in eps:
         if ep.name == name:
             return ep.load()
 
-    available = sorted(ep.name for ep in eps)
+    available = [ep.name for ep in eps]
     raise KeyError(
         f"Unknown store {name!r}. Available stores: {', '.join(available) or '(none)'}"
     )
@@ -48,5 +110,4 @@ def get_store_class(name: str) -> type[SecretStore]:
 
 def list_store_names() -> list[str]:
     """Return sorted names of all registered store plugins."""
-    eps = entry_points(group="enveloper.stores")
-    return sorted(ep.name for ep in eps)
+    return [ep.name for ep in list_store_entry_points()]
@@ -8,9 +8,20 @@ Requires ``boto3`` (install with ``pip install enveloper[aws]``).
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
-from enveloper.store import DEFAULT_NAMESPACE, DEFAULT_PREFIX, DEFAULT_VERSION, SecretStore, is_valid_semver
+from enveloper.store import (
+    DEFAULT_NAMESPACE,
+    DEFAULT_PREFIX,
+    DEFAULT_VERSION,
+    MAX_WORKERS,
+    SecretStore,
+    is_valid_semver,
+)
+
+# ssm:GetParameters accepts at most this many names per call.
+_GET_PARAMETERS_BATCH = 10
 
 _MISSING_BOTO3 = (
     "boto3 is required for the aws store. "
@@ -111,6 +122,30 @@ class AwsSsmStore(SecretStore):
         except self.client.exceptions.ParameterNotFound:
             return None
 
+    def bulk_get(self, keys: Iterable[str], max_workers: int = MAX_WORKERS) -> dict[str, str]:
+        """Fetch via ``GetParameters`` in batches of 10; unknown names are omitted."""
+        by_name = {self._param_name(k): k for k in keys}
+        names = list(by_name)
+        out: dict[str, str] = {}
+        for i in range(0, len(names), _GET_PARAMETERS_BATCH):
+            resp = self.client.get_parameters(
+                Names=names[i:i + _GET_PARAMETERS_BATCH], WithDecryption=True
+            )
+            for param in resp.get("Parameters", []):
+                out[by_name[param["Name"]]] = param["Value"]
+        return out
+
+    def iter_items(self, max_workers: int = MAX_WORKERS) -> Iterator[tuple[str, str]]:
+        """Stream ``(full name, value)`` from ``GetParametersByPath``; no follow-up reads."""
+        paginator = self.client.get_paginator("get_parameters_by_path")
+        for page in paginator.paginate(
+            Path=self._prefix.rstrip("/"), Recursive=True, WithDecryption=True
+        ):
+            for param in page.get("Parameters", []):
+                name: str = param["Name"]
+                if name.startswith(self._prefix):
+                    yield name, param["Value"]
+
     def set(self, key: str, value: str) -> None:
         param_name = self._param_name(key)
         self.client.put_parameter(
@@ -8,10 +8,11 @@ Used when --service file (with optional --path, default .env).
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 
 from enveloper.env_file import parse_env_file
-from enveloper.store import SecretStore
+from enveloper.store import MAX_WORKERS, SecretStore
 
 
 def _format_env_value(value: str) -> str:
@@ -31,6 +32,8 @@ class FileStore(SecretStore):
     service_doc_url: str = "https://github.com/motdotla/dotenv"
 
     key_separator: str = "/"
+    # every set/delete rewrites the whole file
+    thread_safe: bool = False
 
     def __init__(self, path: str | Path = ".env") -> None:
         self._path = Path(path)
@@ -48,11 +51,28 @@ class FileStore(SecretStore):
     def get(self, key: str) -> str | None:
         return self._read().get(key)
 
+    def bulk_get(self, keys: Iterable[str], max_workers: int = MAX_WORKERS) -> dict[str, str]:
+        """Parse the file once and pick out *keys*."""
+        data = self._read()
+        return {k: data[k] for k in keys if k in data}
+
+    def items(self) -> dict[str, str]:
+        return self._read()
+
+    def iter_items(self, max_workers: int = MAX_WORKERS) -> Iterator[tuple[str, str]]:
+        yield from self._read().items()
+
     def set(self, key: str, value: str) -> None:
         data = self._read()
         data[key] = value
         self._write(data)
 
+    def set_many(self, pairs: Mapping[str, str], max_workers: int = MAX_WORKERS) -> None:
+        """Parse and rewrite the file once for all *pairs*."""
+        data = self._read()
+        data.update(pairs)
+        self._write(data)
+
     def delete(self, key: str) -> None:
         data = self._read()
         if key in data:
@@ -14,15 +14,97 @@ keychain.
 
 from __future__ import annotations
 
+import functools
 import json
+from collections.abc import Iterable, Mapping
+from contextlib import closing
+from types import ModuleType
 
-import keyring
-
-from enveloper.store import DEFAULT_PREFIX, DEFAULT_VERSION, SecretStore, is_valid_semver
+from enveloper.store import DEFAULT_PREFIX, DEFAULT_VERSION, MAX_WORKERS, SecretStore, is_valid_semver, map_concurrently
 
 _MANIFEST_KEY = "__keys__"
 
 
+@functools.cache
+def _keyring() -> ModuleType:
+    """Import ``keyring`` on first secret access, not when the store registry is listed."""
+    import keyring
+
+    return keyring
+
+
+# Backends whose get_password may be called from several threads at once: each
+# read is an independent OS call (Security framework, CredRead) or opens its own
+# D-Bus connection (Secret Service).
+_CONCURRENT_READ_BACKENDS = (
+    "keyring.backends.macOS",
+    "keyring.backends.Windows",
+    "keyring.backends.SecretService",
+)
+
+
+def _read_workers(max_workers: int) -> int:
+    """*max_workers* if the active keyring backend tolerates concurrent reads, else 1."""
+    module = type(_keyring().get_keyring()).__module__
+    return max_workers if module.startswith(_CONCURRENT_READ_BACKENDS) else 1
+
+
+# keyring SecretService backend internals the batch read relies on; keyring only
+# promises its public get/set/delete API, so these are checked before use.
+_SECRET_SERVICE_HOOKS = ("_query", "schemes", "scheme", "get_preferred_collection", "unlock")
+
+
+def _secret_service_items(service: str) -> dict[str, str] | None:
+    """Return ``{username: password}`` for every Secret Service item under *service*.
+
+    Through keyring, each read opens its own D-Bus connection and encrypted
+    session; here one connection, one ``SearchItems`` and one session serve
+    every item. Returns ``None`` when the active backend is not Secret
+    Service, lacks the hooks in :data:`_SECRET_SERVICE_HOOKS`, or the batch
+    read fails, so callers fall back to per-key reads. A dismissed unlock
+    prompt raises ``keyring.errors.KeyringLocked`` rather than prompting
+    again for every key.
+    """
+    backend = _keyring().get_keyring()
+    if type(backend).__module__ != "keyring.backends.SecretService":
+        return None
+    if not all(hasattr(backend, name) for name in _SECRET_SERVICE_HOOKS):
+        return None
+    try:
+        from secretstorage.exceptions import SecretStorageException
+        from secretstorage.util import open_session
+    except ImportError:
+        return None
+    errors = _keyring().errors
+    try:
+        username_attr = backend.schemes[backend.scheme]["username"]
+        collection = backend.get_preferred_collection()
+        with closing(collection.connection):
+            session = open_session(collection.connection)
+            out: dict[str, str] = {}
+            for item in collection.search_items(backend._query(service)):
+                backend.unlock(item)
+                item.session = session
+                username = item.get_attributes().get(username_attr)
+                if username is not None and username not in out:
+                    out[username] = item.get_secret().decode("utf-8")
+            return out
+    except errors.KeyringLocked:
+        raise
+    except (AttributeError, KeyError, errors.KeyringError, SecretStorageException):
+        return None
+
+
+def _parse_manifest(raw: str | None) -> list[str]:
+    """Decode a JSON key/domain manifest; missing or corrupt manifests are empty."""
+    if raw is None:
+        return []
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return []
+
+
 _KEYRING_DOC = "https://github.com/jaraco/keyring"
 _SERVICE_PLATFORMS: list[tuple[str, str, str]] = [
     ("local (MacOS)", "macOS Keychain", "https://support.apple.com/guide/keychain-access/welcome/mac"),
@@ -38,6 +120,9 @@ class KeychainStore(SecretStore):
     service_display_name: str = "System keychain"
     service_doc_url: str = _KEYRING_DOC
 
+    # set/delete read-modify-write the key and domain manifests
+    thread_safe: bool = False
+
     # Keychain can use dots; use underscore for compatibility with keyring usernames
     version_separator: str = "_"
     key_separator: str = "/"
@@ -60,9 +145,10 @@ class KeychainStore(SecretStore):
         if not is_valid_semver(version):
             raise ValueError(f"Invalid version format: {version}. Must be valid semver (e.g., 1.0.0)")
 
-    def _username(self, key: str) -> str:
-        if self._domain:
-            return f"{self._domain}/{self._version}/{key}"
+    def _username(self, key: str, domain: str | None = None) -> str:
+        d = domain or self._domain
+        if d:
+            return f"{d}/{self._version}/{key}"
         return f"{self._version}/{key}"
 
     def _manifest_username(self, domain: str | None = None) -> str:
@@ -70,33 +156,76 @@ class KeychainStore(SecretStore):
         return f"{d}/{_MANIFEST_KEY}"
 
     def _read_manifest(self, domain: str | None = None) -> list[str]:
-        raw = keyring.get_password(self._service, self._manifest_username(domain))
-        if raw is None:
-            return []
-        try:
-            return json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
-            return []
+        return _parse_manifest(_keyring().get_password(self._service, self._manifest_username(domain)))
 
     def _write_manifest(self, keys: list[str], domain: str | None = None) -> None:
-        keyring.set_password(
+        _keyring().set_password(
             self._service, self._manifest_username(domain), json.dumps(sorted(set(keys)))
         )
 
     def get(self, key: str) -> str | None:
-        return keyring.get_password(self._service, self._username(key))
+        return _keyring().get_password(self._service, self._username(key))
+
+    def bulk_get(self, keys: Iterable[str], max_workers: int = MAX_WORKERS) -> dict[str, str]:
+        """Read from a pool only when the backend tolerates concurrent reads; otherwise sequentially.
+
+        Reads stay per key: the Secret Service batch in :meth:`read_domains`
+        decrypts every item in the project, which only pays off when the
+        caller wants all of them.
+        """
+        return super().bulk_get(keys, _read_workers(max_workers))
+
+    def read_domains(
+        self, domains: Iterable[str], max_workers: int = MAX_WORKERS,
+    ) -> dict[str, list[tuple[str, str | None]]]:
+        """Return ``{domain: [(key, value or None), ...]}`` for *domains* of this project.
+
+        On Secret Service every manifest and value comes from a single batch
+        read of the project. Otherwise each domain's manifest is read first and
+        the value reads for every domain then share one pool, so many small
+        domains fan out as well as one big one.
+        """
+        domains = list(domains)
+        dumped = _secret_service_items(self._service)
+        if dumped is not None:
+            return {
+                d: [(key, dumped.get(self._username(key, d)))
+                    for key in _parse_manifest(dumped.get(self._manifest_username(d)))]
+                for d in domains
+            }
+        jobs = [(d, key) for d in domains for key in self._read_manifest(d)]
+        get_password = _keyring().get_password
+        values = map_concurrently(
+            lambda job: get_password(self._service, self._username(job[1], job[0])),
+            jobs,
+            _read_workers(max_workers),
+        )
+        out: dict[str, list[tuple[str, str | None]]] = {d: [] for d in domains}
+        for (d, key), val in zip(jobs, values):
+            out[d].append((key, val))
+        return out
 
     def set(self, key: str, value: str) -> None:
-        keyring.set_password(self._service, self._username(key), value)
+        _keyring().set_password(self._service, self._username(key), value)
         manifest = self._read_manifest()
         if key not in manifest:
             manifest.append(key)
             self._write_manifest(manifest)
 
+    def set_many(self, pairs: Mapping[str, str], max_workers: int = MAX_WORKERS) -> None:
+        """Store every pair, then update the key manifest once instead of once per key."""
+        set_password = _keyring().set_password
+        for key, value in pairs.items():
+            set_password(self._service, self._username(key), value)
+        manifest = self._read_manifest()
+        new_keys = [key for key in pairs if key not in manifest]
+        if new_keys:
+            self._write_manifest(manifest + new_keys)
+
     def delete(self, key: str) -> None:
         try:
-            keyring.delete_password(self._service, self._username(key))
-        except keyring.errors.PasswordDeleteError:
+            _keyring().delete_password(self._service, self._username(key))
+        except _keyring().errors.PasswordDeleteError:
             pass
         manifest = self._read_manifest()
         if key in manifest:
@@ -112,36 +241,56 @@ class KeychainStore(SecretStore):
     def clear(self) -> None:
         for key in self._read_manifest():
             try:
-                keyring.delete_password(self._service, self._username(key))
-            except keyring.errors.PasswordDeleteError:
+                _keyring().delete_password(self._service, self._username(key))
+            except _keyring().errors.PasswordDeleteError:
                 pass
         try:
-            keyring.delete_password(self._service, self._manifest_username())
-        except keyring.errors.PasswordDeleteError:
+            _keyring().delete_password(self._service, self._manifest_username())
+        except _keyring().errors.PasswordDeleteError:
             pass
         if self._domain:
             self.unregister_domain(self._domain)
 
+    def clear_domains(self, domains: Iterable[str]) -> None:
+        """Delete every key and key manifest of *domains* and drop them from the domain manifest.
+
+        Same end state as calling ``clear()`` on each domain's store, but the
+        ``__domains__`` manifest is read and rewritten once instead of per domain.
+        """
+        kr = _keyring()
+        not_found = kr.errors.PasswordDeleteError
+        cleared = set(domains)
+        for d in cleared:
+            usernames = [self._username(key, d) for key in self._read_manifest(d)]
+            usernames.append(self._manifest_username(d))
+            for username in usernames:
+                try:
+                    kr.delete_password(self._service, username)
+                except not_found:
+                    pass
+        remaining = [d for d in self.list_domains() if d not in cleared]
+        if remaining:
+            kr.set_password(self._service, "__domains__", json.dumps(sorted(remaining)))
+        else:
+            try:
+                kr.delete_password(self._service, "__domains__")
+            except not_found:
+                pass
+
     def list_domains(self) -> list[str]:
         """Return domain names that have a manifest entry.
 
         This is a best-effort scan: it checks known domain names stored in a
         top-level ``__domains__`` manifest.
         """
-        raw = keyring.get_password(self._service, "__domains__")
-        if raw is None:
-            return []
-        try:
-            return json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
-            return []
+        return _parse_manifest(_keyring().get_password(self._service, "__domains__"))
 
     def register_domain(self, domain: str) -> None:
         """Add *domain* to the top-level domain manifest."""
         domains = self.list_domains()
         if domain not in domains:
             domains.append(domain)
-            keyring.set_password(self._service, "__domains__", json.dumps(sorted(domains)))
+            _keyring().set_password(self._service, "__domains__", json.dumps(sorted(domains)))
 
     def unregister_domain(self, domain: str) -> None:
         """Remove *domain* from the top-level domain manifest (e.g. when last key in domain is deleted)."""
@@ -150,11 +299,11 @@ class KeychainStore(SecretStore):
             return
         domains = [d for d in domains if d != domain]
         if domains:
-            keyring.set_password(self._service, "__domains__", json.dumps(sorted(domains)))
+            _keyring().set_password(self._service, "__domains__", json.dumps(sorted(domains)))
         else:
             try:
-                keyring.delete_password(self._service, "__domains__")
-            except keyring.errors.PasswordDeleteError:
+                _keyring().delete_password(self._service, "__domains__")
+            except _keyring().errors.PasswordDeleteError:
                 pass
 
     def set_with_domain_tracking(self, key: str, value: str) -> None:
@@ -162,3 +311,9 @@ class KeychainStore(SecretStore):
         self.set(key, value)
         if self._domain:
             self.register_domain(self._domain)
+
+    def set_many_with_domain_tracking(self, pairs: Mapping[str, str]) -> None:
+        """:meth:`set_many`, then ensure the domain is registered in the domain manifest."""
+        self.set_many(pairs)
+        if self._domain:
+            self.register_domain(self._domain)
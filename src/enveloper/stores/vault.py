@@ -10,9 +10,10 @@ Uses KV v2: one Vault path holds all keys for the given prefix/path.
 from __future__ import annotations
 
 import os
+from collections.abc import Iterable, Iterator, Mapping
 from typing import Any
 
-from enveloper.store import DEFAULT_NAMESPACE, DEFAULT_PREFIX, DEFAULT_VERSION, SecretStore
+from enveloper.store import DEFAULT_NAMESPACE, DEFAULT_PREFIX, DEFAULT_VERSION, MAX_WORKERS, SecretStore
 
 _MISSING_HVAC = (
     "hvac is required for the vault store. "
@@ -52,6 +53,9 @@ class VaultStore(SecretStore):
     Key format: envr/{domain}/{project}/{version}/{name}.
     """
 
+    # set/delete read-modify-write the one shared secret
+    thread_safe: bool = False
+
     service_name: str = "vault"
     service_display_name: str = "HashiCorp Vault KV v2"
     service_doc_url: str = "https://developer.hashicorp.com/vault/docs"
@@ -128,11 +132,33 @@ class VaultStore(SecretStore):
         data = self._read_data()
         return data.get(self._resolve_key(key))
 
+    def bulk_get(self, keys: Iterable[str], max_workers: int = MAX_WORKERS) -> dict[str, str]:
+        """Read the shared secret once and pick out *keys*."""
+        data = self._read_data()
+        out: dict[str, str] = {}
+        for key in keys:
+            val = data.get(self._resolve_key(key))
+            if val is not None:
+                out[key] = val
+        return out
+
+    def items(self) -> dict[str, str]:
+        return self._read_data()
+
+    def iter_items(self, max_workers: int = MAX_WORKERS) -> Iterator[tuple[str, str]]:
+        yield from self._read_data().items()
+
     def set(self, key: str, value: str) -> None:
         data = self._read_data()
         data[self._resolve_key(key)] = value
         self._write_data(data)
 
+    def set_many(self, pairs: Mapping[str, str], max_workers: int = MAX_WORKERS) -> None:
+        """Merge all *pairs* into the shared secret with one read and one KV write."""
+        data = self._read_data()
+        data.update((self._resolve_key(key), value) for key, value in pairs.items())
+        self._write_data(data)
+
     def delete(self, key: str) -> None:
         data = self._read_data()
         full_key = self._resolve_key(key)
@@ -5,12 +5,55 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+import os
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from enveloper.store import SecretStore
 
 
+@functools.cache
+def _orjson() -> Any:
+    """Return the ``orjson`` module if installed (``pip install enveloper[fast]``), else None."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def cache_dir() -> Path:
+    """``$XDG_CACHE_HOME/enveloper`` (default ``~/.cache/enveloper``) for cross-invocation caches."""
+    from pathlib import Path
+
+    return Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser() / "enveloper"
+
+
+def write_cache_file(name: str, data: bytes, stale_glob: str | None = None) -> None:
+    """Atomically write *data* to ``cache_dir() / name``, owner-only; errors are ignored.
+
+    Files matching *stale_glob* (superseded entries for the same source) are
+    removed first. The directory is created 0700 and files 0600.
+    """
+    import tempfile
+
+    directory = cache_dir()
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if stale_glob:
+            for stale in directory.glob(stale_glob):
+                stale.unlink(missing_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, directory / name)
+    except OSError:
+        pass
+
+
 def strip_domain_prefix(key: str) -> str:
     """Strip domain/project prefix from a key name for use in local environment variables.
 
@@ -31,3 +74,27 @@ def key_to_export_name(store: SecretStore, key: str) -> str:
     rather than envr/domain/proj/1.0.0/API_KEY.
     """
     return store.key_to_export_name(key)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON with orjson when available, else the stdlib.
+
+    Both raise a :class:`json.JSONDecodeError` subclass on bad input.
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+
+    return json.loads(data)
+
+
+def json_dumps_pretty(obj: Any) -> str:
+    """Serialize *obj* as 2-space-indented JSON (non-ASCII kept as-is), via orjson when available."""
+    orjson = _orjson()
+    if orjson is not None:
+        text: str = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        return text
+    import json
+
+    return json.dumps(obj, indent=2, ensure_ascii=False)
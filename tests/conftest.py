@@ -120,6 +120,12 @@ class _FakeCloudStore(SecretStore):
         return cls._shared_data.get(store_id, {})
 
 
+@pytest.fixture(autouse=True)
+def _isolate_cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the CLI's on-disk caches out of the real ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("xdg-cache")))
+
+
 @pytest.fixture(autouse=True)
 def _auto_mock_cloud_store(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
     """Ensure unit tests never push/pull to real AWS or other clouds; skip for integration tests."""
@@ -174,10 +180,9 @@ def _auto_mock_cloud_store(request: pytest.FixtureRequest, monkeypatch: pytest.M
 
         return _store_instances[store_id]
 
+    # The CLI looks up resolve_store.make_cloud_store at call time, so this one
+    # patch also makes push/pull in CLI tests use the fake store.
     monkeypatch.setattr("enveloper.resolve_store.make_cloud_store", fake_make_cloud_store)
-    # CLI imports make_cloud_store at module level as resolve_make_cloud_store;
-    # patch that reference too so push/pull in CLI tests use the fake store.
-    monkeypatch.setattr("enveloper.cli.resolve_make_cloud_store", fake_make_cloud_store)
 
 
 @pytest.fixture(autouse=True)
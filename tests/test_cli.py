@@ -19,6 +19,18 @@ def test_version():
     assert expected_version in result.output
 
 
+def test_main_version_fast_path(monkeypatch, capsys):
+    """``enveloper --version`` via the entry point answers without loading the CLI."""
+    import sys
+
+    from enveloper.__main__ import main
+
+    monkeypatch.setattr(sys, "argv", ["envr", "--version"])
+    main()
+    expected_version = importlib.metadata.version("enveloper")
+    assert capsys.readouterr().out == f"envr, version {expected_version}\n"
+
+
 def test_help():
     runner = CliRunner()
     result = runner.invoke(cli, ["--help"])
@@ -27,6 +39,174 @@ def test_help():
     assert "export" in result.output
 
 
+def test_help_lists_every_lazy_command():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    for name in ("clear", "delete", "export", "generate", "get", "import", "init", "list",
+                 "pull", "push", "service", "set", "stores", "unexport"):
+        assert name in result.output
+
+
+def test_dispatch_imports_only_the_invoked_command_module():
+    """Running one subcommand must not import the other command modules."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from enveloper.cli import cli\n"
+        "assert CliRunner().invoke(cli, ['stores']).exit_code == 0\n"
+        "print(sorted(m for m in sys.modules if m.startswith('enveloper.cli.')))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "['enveloper.cli.service_cmd']"
+
+
+def test_service_listing_does_not_load_keyring_or_cloud_sdks():
+    """`enveloper service` only needs store metadata: keyring and cloud SDKs stay unimported."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from enveloper.cli import cli\n"
+        "assert CliRunner().invoke(cli, ['service']).exit_code == 0\n"
+        "heavy = ('keyring', 'boto3', 'hvac', 'google.cloud', 'azure', 'alibabacloud_kms20160120')\n"
+        "print(sorted(m for m in sys.modules if m.startswith(heavy)))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_piped_export_does_not_load_rich(tmp_path):
+    """export to a pipe (eval "$(enveloper export ...)") writes plain text without importing rich."""
+    import subprocess
+    import sys
+
+    env_file = tmp_path / "app.env"
+    env_file.write_text("A=1\nB=two words\n")
+    code = (
+        "import sys\n"
+        "from enveloper.cli import cli\n"
+        f"cli(['--service', 'file', '--path', {str(env_file)!r}, 'export', '--format', 'unix'], standalone_mode=False)\n"
+        "print(sorted(m for m in sys.modules if m == 'rich' or m.startswith('rich.')), file=sys.stderr)\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout == "export A=1\nexport B='two words'\n"
+    assert proc.stderr.strip() == "[]"
+
+
+def test_console_still_importable_lazily():
+    """``from enveloper.cli import console`` returns the shared stderr console."""
+    from enveloper.cli import _console, console
+
+    assert console is _console()
+
+
+def test_config_parsed_once_until_file_changes(tmp_path, monkeypatch):
+    """The group callback reuses the parsed config until .enveloper.toml changes."""
+    import os
+
+    import enveloper.config as config_mod
+    from enveloper.cli import _load_config_at
+
+    _load_config_at.cache_clear()
+    monkeypatch.chdir(tmp_path)
+    toml = tmp_path / ".enveloper.toml"
+    toml.write_text('[enveloper]\nproject = "first"\n')
+    calls = []
+    real_load = config_mod.load_config
+    monkeypatch.setattr(config_mod, "load_config", lambda p=None: calls.append(p) or real_load(p))
+
+    runner = CliRunner()
+    for _ in range(2):
+        assert runner.invoke(cli, ["--service", "file", "list"]).exit_code == 0
+    assert len(calls) == 1
+
+    toml.write_text('[enveloper]\nproject = "second-project"\n')
+    st = toml.stat()
+    os.utime(toml, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert runner.invoke(cli, ["--service", "file", "list"]).exit_code == 0
+    assert len(calls) == 2
+    assert _load_config_at(calls[-1], None).project == "second-project"
+    _load_config_at.cache_clear()
+
+
+def test_get_store_memoized_per_invocation(tmp_path):
+    """_get_store returns the same instance for the same options within one context."""
+    import click
+
+    from enveloper.cli import _get_store
+    from enveloper.config import EnveloperConfig
+
+    ctx = click.Context(cli, obj={
+        "service": "file", "project": "p", "domain_resolved": "d", "config": EnveloperConfig(),
+        "env_name": None, "path": str(tmp_path / "a.env"), "version": None,
+    })
+    first = _get_store(ctx)
+    assert _get_store(ctx) is first
+    ctx.obj["path"] = str(tmp_path / "b.env")
+    assert _get_store(ctx) is not first
+
+
+def test_mask_hides_short_values_and_keeps_ends_of_long_ones():
+    from enveloper.cli import _mask
+
+    assert _mask("") == "****"
+    assert _mask("abcdef") == "****"
+    assert _mask("abcdefg") == "abc****efg"
+
+
+def test_common_options_are_shared_between_commands():
+    """@common_options attaches the same Option objects to every command, after its own options."""
+    from enveloper.cli.export_cmd import export
+    from enveloper.cli.list_cmd import list_keys
+
+    names = [p.name for p in export.params]
+    assert names == ["fmt", "output", "service", "domain", "project", "version"]
+    assert export.params[-4:] == list_keys.params[-4:]
+    assert all(a is b for a, b in zip(export.params[-4:], list_keys.params[-4:]))
+
+
+def test_common_options_keeps_options_declared_below_it(mock_keyring):
+    """Options and arguments stacked under @common_options still reach the command."""
+    import click
+
+    from enveloper.cli import common_options
+
+    @click.command()
+    @common_options
+    @click.option("--extra", default=None)
+    @click.argument("name")
+    def probe(ctx: click.Context, extra: str | None, name: str) -> None:
+        click.echo(f"{ctx.obj['project']} {extra} {name}")
+
+    cli.add_command(probe)
+    try:
+        result = CliRunner().invoke(cli, ["probe", "--extra", "x", "-p", "proj", "n"])
+    finally:
+        cli.commands.pop("probe")
+    assert result.exit_code == 0, result.output
+    assert result.output == "proj x n\n"
+    assert [p.name for p in probe.params] == ["service", "domain", "project", "version", "extra", "name"]
+
+
+def test_cprofile_flag_writes_pstats(mock_keyring, tmp_path, monkeypatch):
+    """--cprofile dumps cProfile stats for the invocation to ~/.enveloper_profile.pstats."""
+    import pstats
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--cprofile", "--project", "test", "list"])
+    assert result.exit_code == 0
+    stats_file = tmp_path / ".enveloper_profile.pstats"
+    assert stats_file.is_file()
+    assert pstats.Stats(str(stats_file)).total_calls > 0
+
+
 def test_import_and_list(mock_keyring, sample_env):
     runner = CliRunner()
     result = runner.invoke(cli, ["--project", "test", "-d", "aws", "import", str(sample_env)])
@@ -390,6 +570,23 @@ def test_generate_codebuild(mock_keyring, sample_env):
     assert "TWILIO_API_SID: /myapp/test/TWILIO_API_SID" in result.output
 
 
+def test_generate_codebuild_writes_plain_unwrapped_yaml(mock_keyring, tmp_path):
+    """Long parameter paths stay on one line and bracketed names are not treated as markup."""
+    env = tmp_path / ".env"
+    long_name = "A_VERY_LONG_SECRET_NAME_" + "X" * 80
+    env.write_text(f"{long_name}=1\nB=2\n")
+    runner = CliRunner()
+    runner.invoke(cli, ["--project", "cb", "-d", "aws", "import", str(env)])
+    prefix = "/app/[stage]/"
+    result = runner.invoke(cli, ["--project", "cb", "-d", "aws", "generate", "codebuild-env", "--prefix", prefix])
+    assert result.exit_code == 0, result.output
+    assert result.output == (
+        "env:\n  parameter-store:\n"
+        f"    {long_name}: {prefix}{long_name}\n"
+        f"    B: {prefix}B\n"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Bad parameters and missing arguments
 # ---------------------------------------------------------------------------
@@ -728,6 +925,17 @@ def test_export_empty_domain(mock_keyring):
     assert result.output == "" or result.output.strip() == ""
 
 
+def test_export_writes_values_verbatim(mock_keyring):
+    """Export output is written as-is: no markup parsing, no wrapping of long lines."""
+    runner = CliRunner()
+    long_value = "x" * 500
+    runner.invoke(cli, ["--project", "test", "-d", "raw", "set", "MARKUP", "[bold]hi[/bold]"])
+    runner.invoke(cli, ["--project", "test", "-d", "raw", "set", "LONG", long_value])
+    result = runner.invoke(cli, ["--project", "test", "-d", "raw", "export"])
+    assert result.exit_code == 0
+    assert result.output == f"LONG={long_value}\nMARKUP=[bold]hi[/bold]\n"
+
+
 def test_unexport_outputs_unset_commands(mock_keyring):
     """Unexport outputs unset KEY for each key that export would set."""
     runner = CliRunner()
@@ -857,6 +1065,195 @@ def test_pull_from_invalid_store(mock_keyring):
     assert result.exit_code != 0
 
 
+def test_push_then_pull_round_trip(mock_keyring, sample_env, tmp_path):
+    """push copies every keychain secret to the cloud store; pull brings them back into a file."""
+    from tests.conftest import _FakeCloudStore
+
+    _FakeCloudStore.clear_all()
+    runner = CliRunner()
+    runner.invoke(cli, ["--project", "rt", "-d", "aws", "import", str(sample_env)])
+    result = runner.invoke(cli, ["--project", "rt", "-d", "aws", "-v", "push", "--service", "aws", "--max-parallel", "4"])
+    assert result.exit_code == 0, result.output
+    assert "Pushed 7 secret(s) to aws" in result.output
+    pushed = _FakeCloudStore.get_data("aws:aws:rt")
+    assert pushed["envr/aws/rt/1.0.0/TWILIO_API_SID"] == "ACxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
+    assert "  envr/aws/rt/1.0.0/TWILIO_API_SID" in result.output
+
+    out_env = tmp_path / "pulled.env"
+    result = runner.invoke(
+        cli, ["--project", "rt", "-d", "aws", "--path", str(out_env), "pull", "--service", "aws", "--to", "file"],
+    )
+    assert result.exit_code == 0, result.output
+    assert "Pulled 7 secret(s) from aws" in result.output
+    assert "TWILIO_API_SID=ACxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" in out_env.read_text()
+    _FakeCloudStore.clear_all()
+
+
+def test_push_continues_past_failed_keys_and_exits_nonzero(mock_keyring, sample_env, monkeypatch):
+    """A failing set() is reported in a table; the other keys are still pushed and the exit code is 1."""
+    from tests.conftest import _FakeCloudStore
+
+    _FakeCloudStore.clear_all()
+    real_set = _FakeCloudStore.set
+
+    def flaky_set(self, key, value):
+        if key.endswith("TWILIO_API_SID"):
+            raise RuntimeError("ThrottlingException: Rate exceeded")
+        real_set(self, key, value)
+
+    monkeypatch.setattr(_FakeCloudStore, "set", flaky_set)
+    runner = CliRunner()
+    runner.invoke(cli, ["--project", "ft", "-d", "aws", "import", str(sample_env)])
+    result = runner.invoke(cli, ["--project", "ft", "-d", "aws", "push", "--service", "aws"])
+    assert result.exit_code == 1
+    assert "Pushed 6 secret(s) to aws" in result.output
+    assert "Failed to write 1 secret(s)" in result.output
+    assert "ThrottlingException" in result.output
+    pushed = _FakeCloudStore.get_data("aws:aws:ft")
+    assert len(pushed) == 6
+    assert not any(k.endswith("TWILIO_API_SID") for k in pushed)
+    _FakeCloudStore.clear_all()
+
+
+def test_push_and_pull_report_source_read_error_midway(mock_keyring, tmp_path, monkeypatch):
+    """A source that raises partway still gets its earlier pairs written, then a report and exit code 1."""
+    from enveloper.stores.keychain import KeychainStore
+    from tests.conftest import _FakeCloudStore
+
+    _FakeCloudStore.clear_all()
+
+    def throttled(self, max_workers=16):
+        yield "A", "1"
+        yield "B", "2"
+        raise RuntimeError("ThrottlingException on page 2")
+
+    runner = CliRunner()
+    runner.invoke(cli, ["--project", "re", "-d", "aws", "set", "SEED", "x"])
+    monkeypatch.setattr(KeychainStore, "iter_items", throttled)
+    result = runner.invoke(cli, ["--project", "re", "-d", "aws", "push", "--service", "aws"])
+    assert result.exit_code == 1
+    assert "Pushed 2 secret(s) to aws" in result.output
+    assert "ThrottlingException on page 2" in result.output
+    assert "2 secret(s) written and 0 failed" in result.output
+    assert sorted(k.rsplit("/", 1)[-1] for k in _FakeCloudStore.get_data("aws:aws:re")) == ["A", "B"]
+
+    monkeypatch.setattr(_FakeCloudStore, "iter_items", throttled)
+    out = tmp_path / "out.env"
+    result = runner.invoke(
+        cli, ["--project", "re", "-d", "aws", "--service", "aws", "--path", str(out), "pull", "--to", "file"]
+    )
+    assert result.exit_code == 1
+    assert "Pulled 2 secret(s) from aws" in result.output
+    assert "ThrottlingException on page 2" in result.output
+    assert out.read_text() == "A=1\nB=2\n"
+    _FakeCloudStore.clear_all()
+
+
+def test_pull_into_file_writes_once_and_falls_back_per_key(mock_keyring, tmp_path, monkeypatch):
+    """Non-thread-safe targets take one set_many; a failed batch is retried per key to name failures."""
+    from enveloper.stores.file_store import FileStore
+    from tests.conftest import _FakeCloudStore
+
+    _FakeCloudStore.clear_all()
+    env = tmp_path / "src.env"
+    env.write_text("A=1\nB=2\nC=3\n")
+    out = tmp_path / "out.env"
+    runner = CliRunner()
+    runner.invoke(cli, ["--project", "pf", "-d", "aws", "import", str(env)])
+    runner.invoke(cli, ["--project", "pf", "-d", "aws", "push", "--service", "aws"])
+
+    writes: list[int] = []
+    real_write = FileStore._write
+    monkeypatch.setattr(FileStore, "_write", lambda self, data: (writes.append(len(data)), real_write(self, data)))
+    result = runner.invoke(
+        cli, ["--project", "pf", "-d", "aws", "--service", "aws", "--path", str(out), "pull", "--to", "file"]
+    )
+    assert result.exit_code == 0, result.output
+    assert writes == [3]
+    assert FileStore(out).items() == {"A": "1", "B": "2", "C": "3"}
+
+    def broken_set_many(self, pairs, max_workers=16):
+        raise OSError("disk full")
+
+    real_set = FileStore.set
+
+    def flaky_set(self, key, value):
+        if key == "B":
+            raise OSError("read-only")
+        real_set(self, key, value)
+
+    monkeypatch.setattr(FileStore, "set_many", broken_set_many)
+    monkeypatch.setattr(FileStore, "set", flaky_set)
+    out.unlink()
+    result = runner.invoke(
+        cli, ["--project", "pf", "-d", "aws", "--service", "aws", "--path", str(out), "pull", "--to", "file"]
+    )
+    assert result.exit_code == 1
+    assert "Pulled 2 secret(s)" in result.output
+    assert "read-only" in result.output
+    assert FileStore(out).items() == {"A": "1", "C": "3"}
+    _FakeCloudStore.clear_all()
+
+
+def test_push_max_parallel_must_be_positive(mock_keyring):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--project", "rt", "push", "--service", "aws", "--max-parallel", "0"])
+    assert result.exit_code != 0
+    assert "max-parallel" in result.output
+
+
+def test_write_all_overlaps_source_reads_with_writes():
+    """_write_all submits writes while the source is still yielding, and keeps input order."""
+    import threading
+
+    from enveloper.cli.push_pull_cmd import _write_all
+
+    second_written = threading.Event()
+
+    def source():
+        yield "A", "1"
+        yield "B", "2"
+        # B must already be in flight before the source yields C.
+        assert second_written.wait(timeout=5)
+        yield "C", "3"
+
+    def set_value(key: str, value: str) -> None:
+        if key == "C":
+            raise RuntimeError("denied")
+        if key == "B":
+            second_written.set()
+
+    written, failed = _write_all(set_value, source(), max_workers=4)
+    assert written == [("A", "1"), ("B", "2")]
+    assert [(key, str(err)) for key, err in failed] == [("C", "denied")]
+    assert _write_all(set_value, iter(()), max_workers=4) == ([], [])
+
+
+def test_push_verbose_prints_keys_in_chunks(mock_keyring, sample_env, monkeypatch):
+    """--verbose key listing is written in chunks rather than one print per key."""
+    import enveloper.cli.push_pull_cmd as pp
+    from tests.conftest import _FakeCloudStore
+
+    _FakeCloudStore.clear_all()
+    monkeypatch.setattr(pp, "_VERBOSE_CHUNK", 3)
+    printed: list[str] = []
+    real_echo = pp.click.echo
+
+    def spy_echo(message=None, *args, **kwargs):
+        if kwargs.get("err"):
+            printed.append(str(message))
+        return real_echo(message, *args, **kwargs)
+
+    monkeypatch.setattr(pp.click, "echo", spy_echo)
+    runner = CliRunner()
+    runner.invoke(cli, ["--project", "vc", "-d", "aws", "import", str(sample_env)])
+    result = runner.invoke(cli, ["--project", "vc", "-d", "aws", "-v", "push", "--service", "aws"])
+    assert result.exit_code == 0, result.output
+    listings = [p for p in printed if p.startswith("  ")]
+    assert [p.count("\n") + 1 for p in listings] == [3, 3, 1]
+    _FakeCloudStore.clear_all()
+
+
 def test_generate_codebuild_missing_domain(mock_keyring, sample_env):
     """Test codebuild generation without domain."""
     runner = CliRunner()
@@ -946,6 +1343,34 @@ def test_export_to_file_unix_format(mock_keyring, sample_env, tmp_path):
     assert "export TWILIO_API_SID=" in content
 
 
+def test_export_unix_quotes_only_values_with_shell_specials(mock_keyring):
+    """Plain values stay bare; anything the shell could interpret is single-quoted."""
+    import shlex
+
+    from enveloper.cli.export_cmd import _shell_escape
+
+    assert _shell_escape("plain-value_1.2") == "plain-value_1.2"
+    assert _shell_escape("") == "''"
+    for ch in " \t'\"\\$`!#&|;(){}*?~<>[]":
+        quoted = _shell_escape(f"a{ch}b")
+        assert quoted.startswith("'"), repr(ch)
+        assert shlex.split(quoted) == [f"a{ch}b"]
+
+
+def test_write_lines_streams_newline_terminated_lines():
+    """_write_lines consumes a generator lazily and terminates every line; no lines writes nothing."""
+    import io
+
+    from enveloper.cli.export_cmd import _format_export_lines, _write_lines
+
+    buf = io.StringIO()
+    _write_lines(buf, _format_export_lines({"A": "1", "B": "2"}, "dotenv"))
+    assert buf.getvalue() == "A=1\nB=2\n"
+    empty = io.StringIO()
+    _write_lines(empty, iter(()))
+    assert empty.getvalue() == ""
+
+
 def test_export_to_file_win_format(mock_keyring, sample_env, tmp_path):
     """Test exporting secrets in PowerShell format ($env:KEY = 'value')."""
     runner = CliRunner()
@@ -1140,6 +1565,47 @@ def test_import_json_format(mock_keyring, tmp_path):
     assert "abc123" in result.output
 
 
+def test_import_json_nested_domains_and_projects(mock_keyring, tmp_path):
+    """Nested domain -> project -> KEY objects import every leaf."""
+    json_file = tmp_path / "secrets.json"
+    json_file.write_text(
+        '{"aws": {"proj": {"REGION": "us-east-1"}}, "gcp": {"proj": {"API_KEY": "abc123"}}}'
+    )
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--project", "test", "-d", "nest", "import", "--format", "json", str(json_file)])
+    assert result.exit_code == 0
+    assert "Imported 2 variable(s)" in result.output
+    for key, value in (("REGION", "us-east-1"), ("API_KEY", "abc123")):
+        result = runner.invoke(cli, ["--project", "test", "-d", "nest", "get", key])
+        assert value in result.output
+
+
+def test_import_json_mixed_shapes_rejected(mock_keyring, tmp_path):
+    """Leaves at different depths or keys repeated across scopes fail instead of silently merging."""
+    json_file = tmp_path / "secrets.json"
+    runner = CliRunner()
+    for content, message in (
+        ('{"TOP": 1, "aws": {"REGION": "us-east-1", "proj": {"API_KEY": "abc123"}}}', "use one shape throughout"),
+        ('{"A": "1", "dev": {"A": "2"}, "prod": {"p": {"A": "3"}}}', "use one shape throughout"),
+        ('{"dev": {"A": "2"}, "prod": {"A": "3"}}', "appears in more than one domain/project"),
+    ):
+        json_file.write_text(content)
+        result = runner.invoke(cli, ["--project", "test", "-d", "nest", "import", "--format", "json", str(json_file)])
+        assert result.exit_code != 0, content
+        assert message in result.output, content
+    assert runner.invoke(cli, ["--project", "test", "-d", "nest", "list"]).output.count("REGION") == 0
+
+
+def test_import_json_nested_too_deep(mock_keyring, tmp_path):
+    """Objects nested past domain -> project -> KEY are rejected."""
+    json_file = tmp_path / "secrets.json"
+    json_file.write_text('{"d": {"p": {"K": {"too": "deep"}}}}')
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--project", "test", "-d", "nest", "import", "--format", "json", str(json_file)])
+    assert result.exit_code != 0
+    assert "nested too deeply" in result.output
+
+
 def test_import_yaml_format(mock_keyring, tmp_path):
     """Positive: valid YAML object imports and keys are retrievable."""
     yaml_file = tmp_path / "secrets.yaml"
@@ -1328,3 +1794,89 @@ def test_export_yaml_stdout(mock_keyring, sample_env):
     result = runner.invoke(cli, ["--project", "test", "-d", "aws", "export", "--format", "yaml"])
     assert result.exit_code == 0
     assert "TWILIO_API_SID: ACxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" in result.output
+
+
+def test_export_yaml_without_pyyaml(mock_keyring, sample_env, monkeypatch):
+    """When PyYAML is missing, yaml export prints an install hint instead of failing."""
+    import enveloper.cli.export_cmd as export_cmd
+
+    runner = CliRunner()
+    runner.invoke(cli, ["--project", "test", "-d", "aws", "import", str(sample_env)])
+    monkeypatch.setattr(export_cmd, "_load_yaml", lambda: None)
+    result = runner.invoke(cli, ["--project", "test", "-d", "aws", "export", "--format", "yaml"])
+    assert result.exit_code == 0
+    assert "PyYAML is not installed" in result.output
+
+
+def test_cli_import_does_not_load_yaml():
+    """PyYAML is only imported by yaml import/export, not when the CLI package loads."""
+    import subprocess
+    import sys
+
+    code = "import sys\nimport enveloper.cli\nprint('yaml' in sys.modules)\n"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "False"
+
+
+def test_export_yaml_c_dumper_matches_pure_python(mock_keyring, sample_env, monkeypatch):
+    """The libyaml emitter and the pure-Python SafeDumper produce identical, loadable output."""
+    import yaml
+
+    import enveloper.cli.export_cmd as export_cmd
+
+    runner = CliRunner()
+    runner.invoke(cli, ["--project", "test", "-d", "aws", "import", str(sample_env)])
+    args = ["--project", "test", "-d", "aws", "export", "--format", "yaml"]
+    fast = runner.invoke(cli, args)
+    monkeypatch.setattr(export_cmd, "_yaml_dumper", lambda y: y.SafeDumper)
+    slow = runner.invoke(cli, args)
+    assert fast.exit_code == slow.exit_code == 0
+    assert fast.output == slow.output
+    assert yaml.safe_load(fast.output)["TWILIO_AUTH_TOKEN"] == "my secret token"
+
+
+def test_export_sorts_keys_once_for_every_format(mock_keyring, tmp_path):
+    """export writes keys in sorted order regardless of import order or format."""
+    env = tmp_path / ".env"
+    env.write_text("ZED=3\nALPHA=1\nMID=2\n")
+    runner = CliRunner()
+    runner.invoke(cli, ["--project", "p", "--domain", "d", "import", str(env)])
+    for fmt in ("dotenv", "unix", "json", "yaml"):
+        result = runner.invoke(cli, ["--project", "p", "--domain", "d", "export", "--format", fmt])
+        assert result.exit_code == 0, fmt
+        out = result.output
+        assert out.index("ALPHA") < out.index("MID") < out.index("ZED"), fmt
+
+
+def test_list_and_stores_write_tsv_when_piped_and_table_on_tty(mock_keyring, monkeypatch):
+    """Piped stdout gets tab-separated rows; a terminal gets the Rich table."""
+    import click.testing
+
+    runner = CliRunner()
+    runner.invoke(cli, ["--project", "tsv", "-d", "aws", "set", "API_TOKEN", "abcdefghij"])
+
+    result = runner.invoke(cli, ["--project", "tsv", "-d", "aws", "list"])
+    assert result.exit_code == 0
+    assert "API_TOKEN\tabc****hij\n" in result.output
+    assert "Value (masked)" not in result.output
+
+    result = runner.invoke(cli, ["stores"])
+    assert "aws\tenveloper.stores.aws_ssm:AwsSsmStore\n" in result.output
+
+    # CliRunner swaps in its own stdout wrapper; make it report a terminal.
+    monkeypatch.setattr(click.testing._NamedTextIOWrapper, "isatty", lambda self: True)
+    result = runner.invoke(cli, ["--project", "tsv", "-d", "aws", "list"])
+    assert result.exit_code == 0
+    assert "Value (masked)" in result.output
+    assert "API_TOKEN" in result.output
+
+
+def test_list_all_domains_sorted_by_domain_then_key(mock_keyring):
+    """Listing every domain yields rows ordered by domain, then key."""
+    runner = CliRunner()
+    for domain, key in [("gcp", "ZED"), ("aws", "BETA"), ("gcp", "ALPHA"), ("aws", "ALPHA")]:
+        runner.invoke(cli, ["--project", "ord", "-d", domain, "set", key, "value-1234"])
+    result = runner.invoke(cli, ["--project", "ord", "list"])
+    assert result.exit_code == 0
+    rows = [line.split("\t")[1:4:2] for line in result.output.splitlines()]
+    assert rows == [["aws", "ALPHA"], ["aws", "BETA"], ["gcp", "ALPHA"], ["gcp", "ZED"]]
@@ -63,3 +63,9 @@ def test_malformed_lines_skipped(tmp_path):
     p.write_text("GOOD=value\nno_equals\n=missing_key\n123BAD=nope\n")
     result = parse_env_file(p)
     assert result == {"GOOD": "value"}
+
+
+def test_crlf_and_missing_final_newline(tmp_path):
+    p = tmp_path / "windows.env"
+    p.write_bytes(b"A=1\r\nB='two'\r\nC=3")
+    assert parse_env_file(p) == {"A": "1", "B": "two", "C": "3"}
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from enveloper.stores.keychain import KeychainStore
 
 
@@ -75,6 +77,19 @@ def test_set_with_domain_tracking(mock_keyring):
     assert "aws" in global_store.list_domains()
 
 
+def test_set_many_writes_manifest_once(mock_keyring, monkeypatch):
+    """set_many stores every pair and rewrites the key manifest a single time."""
+    store = KeychainStore(project="test", domain="aws")
+    store.set("A", "old")
+    writes: list[list[str]] = []
+    real_write = store._write_manifest
+    monkeypatch.setattr(store, "_write_manifest", lambda keys, domain=None: (writes.append(keys), real_write(keys, domain)))
+    store.set_many_with_domain_tracking({"A": "1", "B": "2", "C": "3"})
+    assert writes == [["A", "B", "C"]]
+    assert store.bulk_get(["A", "B", "C"]) == {"A": "1", "B": "2", "C": "3"}
+    assert "aws" in KeychainStore(project="test").list_domains()
+
+
 def test_manifest_consistency_after_set_delete(mock_keyring):
     store = KeychainStore(project="test", domain="aws")
     store.set("A", "1")
@@ -92,3 +107,175 @@ def test_delete_last_key_unregisters_domain(mock_keyring):
     assert "aws" in global_store.list_domains()
     store.delete("name")
     assert "aws" not in global_store.list_domains()
+
+
+def test_clear_domains_removes_every_domain_and_the_domain_manifest(mock_keyring):
+    """clear_domains leaves nothing behind for the project, and other projects are untouched."""
+    for domain in ("aws", "gcp"):
+        KeychainStore(project="cd", domain=domain).set_with_domain_tracking("K", domain)
+    KeychainStore(project="other", domain="aws").set_with_domain_tracking("K", "keep")
+    global_store = KeychainStore(project="cd")
+    global_store.clear_domains(global_store.list_domains())
+    assert not [k for k in mock_keyring if k[0] == global_store._service]
+    assert KeychainStore(project="other", domain="aws").get("K") == "keep"
+
+
+def test_clear_domains_keeps_domains_not_passed(mock_keyring):
+    """Clearing some domains leaves the others' keys and manifest entries in place."""
+    for domain in ("aws", "gcp", "azure"):
+        KeychainStore(project="cp", domain=domain).set_with_domain_tracking("K", domain)
+    global_store = KeychainStore(project="cp")
+    global_store.clear_domains(["aws", "azure"])
+    assert global_store.list_domains() == ["gcp"]
+    assert KeychainStore(project="cp", domain="gcp").get("K") == "gcp"
+    assert KeychainStore(project="cp", domain="aws").list_keys() == []
+
+
+def test_read_domains_returns_each_domains_pairs(mock_keyring):
+    """read_domains lists every domain's manifest and reads all values in one pass."""
+    KeychainStore(project="rd", domain="aws").set_with_domain_tracking("A", "1")
+    KeychainStore(project="rd", domain="gcp").set_with_domain_tracking("B", "2")
+    global_store = KeychainStore(project="rd")
+    got = global_store.read_domains(["aws", "gcp", "none"])
+    assert got == {"aws": [("A", "1")], "gcp": [("B", "2")], "none": []}
+
+
+def test_concurrent_reads_only_for_known_backends(monkeypatch):
+    """bulk_get uses a thread pool only when the keyring backend handles concurrent reads."""
+    import keyring
+
+    from enveloper.stores import keychain
+
+    class FakeSecretService:
+        pass
+
+    FakeSecretService.__module__ = "keyring.backends.SecretService"
+
+    class FakeFail:
+        pass
+
+    FakeFail.__module__ = "keyring.backends.fail"
+
+    monkeypatch.setattr(keyring, "get_keyring", lambda: FakeSecretService())
+    assert keychain._read_workers(8) == 8
+    monkeypatch.setattr(keyring, "get_keyring", lambda: FakeFail())
+    assert keychain._read_workers(8) == 1
+
+
+def test_read_domains_batches_secret_service_in_one_session(monkeypatch):
+    """On Secret Service, read_domains searches the project once and shares one session for every item."""
+    import json
+
+    import keyring
+    import secretstorage.util
+
+    calls = {"connections": 0, "sessions": 0, "searches": []}
+    service = KeychainStore(project="ss")._service
+    stored = {
+        "aws/__keys__": json.dumps(["A", "B"]),
+        "aws/1.0.0/A": "1",
+        "gcp/__keys__": json.dumps(["C"]),
+        "gcp/1.0.0/C": "3",
+    }
+
+    class Item:
+        def __init__(self, username):
+            self.username = username
+            self.session = None
+
+        def get_attributes(self):
+            return {"username": self.username, "service": service}
+
+        def get_secret(self):
+            assert self.session == "shared-session"
+            return stored[self.username].encode()
+
+    class Connection:
+        def close(self):
+            pass
+
+    class Collection:
+        connection = Connection()
+
+        def search_items(self, query):
+            calls["searches"].append(query)
+            return [Item(u) for u in stored]
+
+    class Backend:
+        schemes = {"default": {"username": "username", "service": "service"}}
+        scheme = "default"
+
+        def _query(self, service, username=None):
+            return {"service": service}
+
+        def get_preferred_collection(self):
+            calls["connections"] += 1
+            return Collection()
+
+        def unlock(self, item):
+            pass
+
+    Backend.__module__ = "keyring.backends.SecretService"
+
+    def open_session(connection):
+        calls["sessions"] += 1
+        return "shared-session"
+
+    monkeypatch.setattr(keyring, "get_keyring", lambda: Backend())
+    monkeypatch.setattr(secretstorage.util, "open_session", open_session)
+    got = KeychainStore(project="ss").read_domains(["aws", "gcp"])
+    assert got == {"aws": [("A", "1"), ("B", None)], "gcp": [("C", "3")]}
+    assert calls == {"connections": 1, "sessions": 1, "searches": [{"service": service}]}
+
+    # bulk_get reads only the requested keys, never the whole-project batch.
+    monkeypatch.setattr(keyring, "get_password", lambda svc, username: stored.get(username))
+    assert KeychainStore(project="ss", domain="aws").bulk_get(["A", "B", "C"]) == {"A": "1"}
+    assert calls["sessions"] == 1
+
+
+def test_secret_service_batch_hooks_exist_on_real_backend():
+    """keyring's SecretService backend still exposes the internals the batch read uses."""
+    pytest.importorskip("secretstorage")
+    from keyring.backends.SecretService import Keyring
+
+    from enveloper.stores.keychain import _SECRET_SERVICE_HOOKS
+
+    assert [name for name in _SECRET_SERVICE_HOOKS if not hasattr(Keyring, name)] == []
+
+
+def test_secret_service_batch_falls_back_or_raises_locked(monkeypatch):
+    """Missing hooks or Secret Service errors fall back to per-key reads; a dismissed prompt raises."""
+    import keyring
+    from keyring.errors import InitError, KeyringLocked
+
+    from enveloper.stores import keychain
+
+    class NoHooks:
+        pass
+
+    NoHooks.__module__ = "keyring.backends.SecretService"
+    monkeypatch.setattr(keyring, "get_keyring", lambda: NoHooks())
+    assert keychain._secret_service_items("envr:p") is None
+
+    class Backend:
+        schemes = {"default": {"username": "username"}}
+        scheme = "default"
+        error: Exception = InitError("no collection")
+
+        def _query(self, service):
+            return {"service": service}
+
+        def get_preferred_collection(self):
+            raise self.error
+
+        def unlock(self, item):
+            pass
+
+    Backend.__module__ = "keyring.backends.SecretService"
+    monkeypatch.setattr(keyring, "get_keyring", lambda: Backend())
+    assert keychain._secret_service_items("envr:p") is None
+
+    Backend.error = KeyringLocked("Failed to unlock the collection!")
+    monkeypatch.setattr(keyring, "get_password", lambda *a: pytest.fail("per-key retry after dismissed prompt"))
+    with pytest.raises(KeyringLocked):
+        KeychainStore(project="p").read_domains(["aws"])
@@ -60,3 +60,58 @@ def test_get_keychain_store_class():
 def test_get_unknown_store_raises():
     with pytest.raises(KeyError, match="Unknown store"):
         get_store_class("nonexistent-store")
+
+
+def test_store_entry_points_scanned_once(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    """Registry lookups share one cached entry-point scan."""
+    import enveloper.stores as stores_mod
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    real = stores_mod.entry_points
+    calls: list[str] = []
+
+    def counting_entry_points(*, group: str):
+        calls.append(group)
+        return real(group=group)
+
+    monkeypatch.setattr(stores_mod, "entry_points", counting_entry_points)
+    stores_mod.list_store_entry_points.cache_clear()
+    try:
+        assert "aws" in list_store_names()
+        assert get_store_class("keychain") is KeychainStore
+        list(get_service_entries())
+        assert calls == ["enveloper.stores"]
+    finally:
+        stores_mod.list_store_entry_points.cache_clear()
+
+
+def test_store_entry_points_disk_cache(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    """A new process reuses the persisted scan; ENVELOPER_NO_CACHE rescans."""
+    import enveloper.stores as stores_mod
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    real = stores_mod.entry_points
+    calls: list[str] = []
+
+    def counting_entry_points(*, group: str):
+        calls.append(group)
+        return real(group=group)
+
+    monkeypatch.setattr(stores_mod, "entry_points", counting_entry_points)
+    try:
+        stores_mod.list_store_entry_points.cache_clear()
+        scanned = list_store_names()
+        assert len(list((tmp_path / "enveloper").glob("eps-*.json"))) == 1
+
+        stores_mod.list_store_entry_points.cache_clear()
+        assert list_store_names() == scanned
+        assert get_store_class("keychain") is KeychainStore
+        assert calls == ["enveloper.stores"]
+
+        monkeypatch.setenv("ENVELOPER_NO_CACHE", "1")
+        stores_mod.list_store_entry_points.cache_clear()
+        assert list_store_names() == scanned
+        assert calls == ["enveloper.stores", "enveloper.stores"]
+    finally:
+        stores_mod.list_store_entry_points.cache_clear()
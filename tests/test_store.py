@@ -4,9 +4,29 @@ from __future__ import annotations
 
 import pytest
 
+from enveloper.store import SecretStore
 from enveloper.stores.aws_ssm import AwsSsmStore
 
 
+class _DictStore(SecretStore):
+    """Minimal in-memory store for exercising SecretStore's default bulk methods."""
+
+    def __init__(self, data: dict[str, str] | None = None):
+        self._data = {} if data is None else data
+
+    def get(self, key):
+        return self._data.get(key)
+
+    def set(self, key, value):
+        self._data[key] = value
+
+    def delete(self, key):
+        self._data.pop(key, None)
+
+    def list_keys(self):
+        return sorted(self._data)
+
+
 def test_sanitize_key_segment_replaces_separator():
     """Key segment containing key_separator is replaced so key path is not broken."""
     sep = AwsSsmStore.key_separator  # "/"
@@ -77,3 +97,124 @@ def test_aws_store_invalid_version_raises():
         AwsSsmStore(version="v1.0.0", domain="d", project="p")
     with pytest.raises(ValueError, match="Invalid version|semver"):
         AwsSsmStore(version="", domain="d", project="p")
+
+
+def test_bulk_get_default_omits_missing_and_keeps_order():
+    """Default bulk_get fans out get() calls and drops keys that do not exist."""
+    data = {f"K{i}": str(i) for i in range(40)}
+    store = _DictStore(data)
+    wanted = [*data, "MISSING"]
+    assert store.bulk_get(wanted) == data
+    assert list(store.bulk_get(wanted)) == list(data)
+    assert store.bulk_get([]) == {}
+
+
+def test_aws_bulk_get_batches_get_parameters_by_ten():
+    """AwsSsmStore.bulk_get uses GetParameters in chunks of 10 and maps names back to keys."""
+
+    class _Client:
+        def __init__(self):
+            self.calls = []
+
+        def get_parameters(self, Names, WithDecryption):
+            assert WithDecryption is True
+            self.calls.append(list(Names))
+            return {
+                "Parameters": [{"Name": n, "Value": n.upper()} for n in Names if not n.endswith("GONE")],
+                "InvalidParameters": [n for n in Names if n.endswith("GONE")],
+            }
+
+    store = AwsSsmStore(prefix="/envr/", domain="dom", project="proj")
+    store._client = _Client()
+    keys = [f"K{i}" for i in range(23)] + ["GONE"]
+    got = store.bulk_get(keys)
+    assert [len(c) for c in store._client.calls] == [10, 10, 4]
+    assert "GONE" not in got
+    assert got["K0"] == "/ENVR/DOM/PROJ/1.0.0/K0"
+    assert len(got) == 23
+
+
+def test_aws_iter_items_streams_get_parameters_by_path():
+    """AwsSsmStore.iter_items yields name/value pairs from the paginator without per-key reads."""
+
+    class _Paginator:
+        def paginate(self, Path, Recursive, WithDecryption):
+            assert (Path, Recursive, WithDecryption) == ("/envr/dom/proj", True, True)
+            yield {"Parameters": [{"Name": "/envr/dom/proj/1.0.0/A", "Value": "1"}]}
+            yield {"Parameters": [{"Name": "/envr/dom/proj/1.0.0/B", "Value": "2"}]}
+
+    class _Client:
+        def get_paginator(self, op):
+            assert op == "get_parameters_by_path"
+            return _Paginator()
+
+        def get_parameter(self, **kwargs):
+            raise AssertionError("iter_items must not issue per-key reads")
+
+    store = AwsSsmStore(prefix="/envr/dom/proj/", domain="dom", project="proj")
+    store._client = _Client()
+    assert list(store.iter_items()) == [
+        ("/envr/dom/proj/1.0.0/A", "1"),
+        ("/envr/dom/proj/1.0.0/B", "2"),
+    ]
+
+
+def test_map_concurrently_preserves_order_and_runs_first_item_inline():
+    """map_concurrently returns results in input order; the first call runs on the caller's thread."""
+    import threading
+
+    from enveloper.store import map_concurrently
+
+    caller = threading.get_ident()
+    seen: dict[int, int] = {}
+
+    def work(n):
+        seen[n] = threading.get_ident()
+        return n * n
+
+    assert map_concurrently(work, range(20)) == [n * n for n in range(20)]
+    assert seen[0] == caller
+    assert map_concurrently(work, []) == []
+
+
+def test_map_concurrently_propagates_errors():
+    from enveloper.store import map_concurrently
+
+    def boom(n):
+        if n == 3:
+            raise ValueError("bad item")
+        return n
+
+    with pytest.raises(ValueError, match="bad item"):
+        map_concurrently(boom, range(5))
+
+
+def test_items_default_and_file_store(tmp_path):
+    """items() returns every key/value pair: via bulk_get by default, one parse for FileStore."""
+    from enveloper.stores.file_store import FileStore
+
+    env = tmp_path / ".env"
+    env.write_text("A=1\nB=two\n")
+    store = FileStore(env)
+    assert store.items() == {"A": "1", "B": "two"}
+    assert super(FileStore, store).items() == {"A": "1", "B": "two"}
+
+
+def test_set_many_default_and_single_write_overrides(tmp_path):
+    """set_many stores every pair; FileStore rewrites its file once for the whole batch."""
+    from enveloper.stores.file_store import FileStore
+
+    pairs = {f"K{i}": str(i) for i in range(40)}
+    store = _DictStore()
+    store.set_many(pairs)
+    assert store.items() == pairs
+
+    env = tmp_path / ".env"
+    env.write_text("A=1\n")
+    file_store = FileStore(env)
+    writes: list[dict[str, str]] = []
+    real_write = file_store._write
+    file_store._write = lambda data: (writes.append(dict(data)), real_write(data))
+    file_store.set_many({"B": "2", "A": "one"})
+    assert writes == [{"A": "one", "B": "2"}]
+    assert file_store.items() == {"A": "one", "B": "2"}
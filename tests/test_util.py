@@ -52,3 +52,48 @@ def test_key_to_export_name_fallback():
     assert key_to_export_name(store, "plain_key") == "plain_key"
     sep = store.key_separator
     assert key_to_export_name(store, f"a{sep}b{sep}c") == "c"
+
+
+def test_key_to_export_name_plain_name_skips_parse(monkeypatch):
+    """Names without the separator are returned as-is without calling parse_key."""
+    from enveloper.stores.file_store import FileStore
+
+    store = FileStore(path=".env")
+
+    def fail(key):
+        raise AssertionError("parse_key should not run for plain names")
+
+    monkeypatch.setattr(store, "parse_key", fail)
+    assert key_to_export_name(store, "API_KEY") == "API_KEY"
+
+
+def test_json_helpers_stdlib_fallback(monkeypatch):
+    """Without orjson the helpers use the stdlib and produce the same layout."""
+    import json
+
+    from enveloper import util
+
+    monkeypatch.setattr(util, "_orjson", lambda: None)
+    pairs = {"B": "café", "A": "1"}
+    text = util.json_dumps_pretty(pairs)
+    assert text == '{\n  "B": "café",\n  "A": "1"\n}'
+    assert util.json_loads(text.encode()) == pairs
+    try:
+        util.json_loads(b"{not json")
+    except json.JSONDecodeError:
+        pass
+    else:
+        raise AssertionError("expected JSONDecodeError")
+
+
+def test_json_helpers_match_between_backends():
+    """orjson (when installed) and the stdlib fallback serialize identically."""
+    import json
+
+    import pytest
+
+    pytest.importorskip("orjson")
+    from enveloper import util
+
+    pairs = {"B": "café", "A": 'x"y'}
+    assert util.json_dumps_pretty(pairs) == json.dumps(pairs, indent=2, ensure_ascii=False)